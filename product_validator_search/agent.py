@@ -6,22 +6,30 @@ Architecture:
   │     └── plan_generator (LlmAgent)
   │           output_schema: ResearchPlan → state "research_plan"
   └── sub_agent: execution_pipeline (SequentialAgent)
-        ├── market_research (ResilientParallelAgent)
-        │     ├── brave_search_agent  → state "brave_search_validation"
-        │     ├── google_trends_agent → state "google_trends_validation"
-        │     └── competitors_agent   → state "competitors_validation"
-        ├── buyer_intent_research (ResilientParallelAgent)
-        │     ├── review_sites_agent  → state "review_sites_validation"
-        │     ├── jobs_signal_agent   → state "jobs_signal_validation"
-        │     └── seo_intent_agent    → state "seo_intent_validation"
-        ├── community_tech_research (ResilientParallelAgent)
-        │     ├── hackernews_agent    → state "hackernews_validation"
-        │     ├── reddit_agent        → state "reddit_validation"
-        │     ├── github_agent        → state "github_validation"
-        │     └── openalex_agent      → state "openalex_validation"
+        ├── all_sources_research (ResilientParallelAgent)
+        │     ├── market_research (ResilientParallelAgent)
+        │     │     ├── brave_search_agent  → state "brave_search_validation"
+        │     │     ├── google_trends_agent → state "google_trends_validation"
+        │     │     └── competitors_agent   → state "competitors_validation"
+        │     ├── buyer_intent_research (ResilientParallelAgent)
+        │     │     ├── review_sites_agent  → state "review_sites_validation"
+        │     │     ├── jobs_signal_agent   → state "jobs_signal_raw_report"
+        │     │     └── seo_intent_agent    → state "seo_intent_validation"
+        │     └── community_tech_research (ResilientParallelAgent)
+        │           ├── hackernews_agent    → state "hackernews_raw_report"
+        │           ├── reddit_agent        → state "reddit_validation"
+        │           ├── github_agent        → state "github_validation"
+        │           └── openalex_agent      → state "openalex_validation"
+        ├── multi_source_validator (LlmAgent)
+        │     output_schema: MultiSourceValidation → state
+        │     "hackernews_validation" + "jobs_signal_validation"
         └── final_validator (LlmAgent)
               free-form markdown → state "final_validation"
               (also saved to reports/ as .md file via callback)
+
+The tree is wrapped in an ADK `App` with context caching enabled, so each
+agent's static instruction (plus tool declarations) is cached provider-side
+and re-used across refinement rounds and runs instead of being re-billed.
 """
 
 from __future__ import annotations
@@ -32,11 +40,14 @@ from typing import Literal
 
 from google.adk.agents import LlmAgent, SequentialAgent
 from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
 from google.adk.tools.agent_tool import AgentTool
 from pydantic import BaseModel, Field
 
 from .config import config
 from .resilient_parallel_agent import ResilientParallelAgent
+from .schema_utils import freeze_json_schema
 from .sources.hackernews import hackernews_agent
 from .sources.openalex import openalex_agent
 from .sources.google_trends import google_trends_agent
@@ -47,6 +58,7 @@ from .sources.competitors import competitors_agent
 from .sources.review_sites import review_sites_agent
 from .sources.jobs_signal import jobs_signal_agent
 from .sources.seo_intent import seo_intent_agent
+from .sources.multi_source_validator import multi_source_validator
 
 # ---------------------------------------------------------------------------
 # Pydantic schemas for structured agent outputs
@@ -66,6 +78,7 @@ SOURCE_NAMES = [
 ]
 
 
+@freeze_json_schema
 class ResearchPlan(BaseModel):
     """Structured plan produced by the plan_generator agent."""
 
@@ -221,6 +234,10 @@ Available sources: {", ".join(SOURCE_NAMES)}
 
 # ---------------------------------------------------------------------------
 # Split Execution — Resilient parallel batches for speed + fault isolation
+#
+# Each source writes a distinct `*_validation` / `*_raw_report` state key, so
+# the batches themselves also run concurrently: wall clock is bounded by the
+# slowest source rather than the sum of the three batches.
 # ---------------------------------------------------------------------------
 
 market_research = ResilientParallelAgent(
@@ -251,6 +268,15 @@ community_tech_research = ResilientParallelAgent(
     ],
 )
 
+all_sources_research = ResilientParallelAgent(
+    name="all_sources_research",
+    sub_agents=[
+        market_research,
+        buyer_intent_research,
+        community_tech_research,
+    ],
+)
+
 # ---------------------------------------------------------------------------
 # final_validator — aggregates all evidence into a readable markdown report
 # ---------------------------------------------------------------------------
@@ -268,9 +294,9 @@ human-readable product validation report in well-structured markdown.
 
 - `research_plan` — the original plan
 - `hackernews_validation`, `hackernews_raw_report`
-- `openalex_validation`, `openalex_raw_report`
+- `openalex_validation` (researched and assessed in one pass; `openalex_raw_report` only marks a skip)
 - `google_trends_validation`, `google_trends_raw_report`
-- `reddit_validation`, `reddit_raw_report`
+- `reddit_validation` (researched and assessed in one pass; `reddit_raw_report` only marks a skip)
 - `github_validation`, `github_raw_report`
 - `brave_search_validation`, `brave_search_raw_report`
 - `competitors_validation`, `competitors_raw_report`
@@ -458,15 +484,14 @@ def _save_report_callback(callback_context: CallbackContext) -> None:
 
 
 # ---------------------------------------------------------------------------
-# execution_pipeline — Batched Parallel Search → Final Validation (+ save to file)
+# execution_pipeline — Parallel Search → Final Validation (+ save to file)
 # ---------------------------------------------------------------------------
 
 execution_pipeline = SequentialAgent(
     name="execution_pipeline",
     sub_agents=[
-        market_research,  # Batch 1: Market timing + competitors
-        buyer_intent_research,  # Batch 2: Buyer-intent sources
-        community_tech_research,  # Batch 3: Reddit, HN, GitHub, OpenAlex
+        all_sources_research,  # Market, buyer-intent, and community batches at once
+        multi_source_validator,  # One critic call for HN + jobs signal
         final_validator,  # Synthesis
     ],
     after_agent_callback=_save_report_callback,
@@ -535,5 +560,16 @@ multiple data sources.
 # ---------------------------------------------------------------------------
 
 root_agent = interactive_planner
+
+# `adk web` / `adk run` pick up `app` ahead of `root_agent`.
+app = App(
+    name="product_validator_search",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        cache_intervals=config.context_cache_intervals,
+        ttl_seconds=config.context_cache_ttl_seconds,
+        min_tokens=config.context_cache_min_tokens,
+    ),
+)
 # Export batched source runners for testing if needed
 parallel_search = market_research  # Legacy export for smoke tests
@@ -14,6 +14,11 @@ class ResearchConfiguration:
     critic_model: str = "gemini-3-flash-preview"
     worker_model: str = "gemini-3-flash-preview"
     max_search_iterations: int = 5
+    context_cache_ttl_seconds: int = 300
+    context_cache_min_tokens: int = 2048
+    context_cache_intervals: int = 10
+    openalex_cache_dir: str = ".openalex_cache"
+    openalex_cache_ttl: int = 86400
     adaptive_refinement_rounds: int = 2
     adaptive_run_condition: str = "conditional"
     adaptive_max_queries_per_round: int = 4
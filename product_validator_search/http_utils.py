@@ -0,0 +1,134 @@
+"""Shared HTTP client, concurrency caps, and retry policy for external calls.
+
+All source tools fetch through one pooled HTTP/2 ``httpx.AsyncClient`` from
+``get_client()``, so keepalive sockets, TLS sessions, and HTTP/2 streams are
+reused across sources for the whole validation run.
+
+Algolia and Brave both rate-limit. A transient 429/5xx that escapes a tool
+call makes the agent re-prompt the model, which costs far more than simply
+retrying the request. Source tools therefore wrap their outbound calls with
+``retry_transient`` (bounded, jittered exponential backoff) and hold a
+per-host semaphore from ``get_semaphore()`` while a request is in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from typing import Optional
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# ---------------------------------------------------------------------------
+# Shared client
+# ---------------------------------------------------------------------------
+
+# httpx drops idle connections after 5 s by default, shorter than a typical
+# LLM turn between tool calls; keep them for 30 s (under nginx's 75 s) so
+# follow-up requests reuse the socket instead of a fresh TLS handshake.
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=100, keepalive_expiry=30.0
+)
+_DEFAULT_TIMEOUT = 15.0
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP/2 client, creating it on first use.
+
+    Pooled connections belong to the event loop that opened them, so a new
+    client is created if the running loop changes (e.g. successive
+    ``asyncio.run`` calls from scripts).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(http2=True, limits=_LIMITS, timeout=_DEFAULT_TIMEOUT)
+        _client_loop = loop
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared client, if one is open."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+@atexit.register
+def _close_client_at_exit() -> None:
+    # Only the owning loop can close pooled connections; if it is already
+    # gone the sockets are released with the process.
+    loop = _client_loop
+    if _client is None or loop is None or loop.is_closed() or loop.is_running():
+        return
+    loop.run_until_complete(aclose_client())
+
+
+# ---------------------------------------------------------------------------
+# Per-host concurrency caps
+# ---------------------------------------------------------------------------
+
+_SEMAPHORE_LIMITS = {
+    "hackernews": 8,
+    "brave": 4,
+    # OpenAlex allows ~10 requests/second per client.
+    "openalex": 10,
+    "reddit": 4,
+}
+
+_semaphores: dict[str, asyncio.Semaphore] = {}
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_semaphore(host: str) -> asyncio.Semaphore:
+    """Return the concurrency cap for `host` on the running event loop.
+
+    Like the shared client, a semaphore that has had waiters is bound to
+    that loop, so the registry is rebuilt when the running loop changes.
+
+    Args:
+        host: One of the keys of ``_SEMAPHORE_LIMITS``.
+    """
+    global _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore_loop is not loop:
+        _semaphores.clear()
+        _semaphore_loop = loop
+    semaphore = _semaphores.get(host)
+    if semaphore is None:
+        semaphore = _semaphores[host] = asyncio.Semaphore(_SEMAPHORE_LIMITS[host])
+    return semaphore
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True for errors worth retrying: throttling, 5xx, and transport faults."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
+
+# Works on both sync and async callables. The final failure is re-raised
+# unchanged so callers keep their existing error handling.
+retry_transient = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(multiplier=0.3, max=8),
+    retry=retry_if_exception(is_transient_error),
+    reraise=True,
+)
@@ -0,0 +1,46 @@
+"""Lazy package exports for source agents.
+
+Constructing a source's agents (and importing ADK to do so) is the bulk of
+package import time. Packages that re-export agents call ``lazy_exports`` so
+that importing a single tool module, such as ``sources.openalex.search_tool``,
+does not build any agents; each export is imported on first access.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import Any
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> None:
+    """Resolve a package's exports from their submodules on first access.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Exported name -> relative module defining it
+            (e.g. ``{"reddit_agent": ".reddit_agent"}``).
+    """
+
+    class _LazyPackage(types.ModuleType):
+        def __getattr__(self, name: str) -> Any:
+            if name not in exports:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+            value = getattr(importlib.import_module(exports[name], package), name)
+            super().__setattr__(name, value)
+            return value
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            # Importing a submodule binds it on the package. Where it shares a
+            # name with an export (e.g. `reddit_agent`), bind the exports it
+            # defines instead, as an eager `from .reddit_agent import ...`
+            # would have.
+            if name in exports and getattr(value, "__name__", None) == f"{package}.{name}":
+                for export, source in exports.items():
+                    if source == f".{name}":
+                        super().__setattr__(export, getattr(value, export))
+                return
+            super().__setattr__(name, value)
+
+    sys.modules[package].__class__ = _LazyPackage
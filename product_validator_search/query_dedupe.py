@@ -0,0 +1,100 @@
+"""Per-run deduplication of outbound search queries.
+
+Researchers issue validation, invalidation, and refinement probes that often
+collapse to the same query text across rounds. Tools check
+``is_duplicate_query`` before hitting an external API and call
+``record_query`` only once the call succeeds, so each (endpoint, normalized
+query, result limit) triple is fetched successfully at most once per
+invocation (one validation run), while failed calls stay retryable.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from google.adk.tools.tool_context import ToolContext
+
+_STATE_KEY = "_executed_queries"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse runs of whitespace.
+
+    Args:
+        query: The raw query string.
+
+    Returns:
+        The canonical form used for deduplication.
+    """
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+
+def _query_key(endpoint: str, query: str, limit: Optional[int]) -> str:
+    key = f"{endpoint}:{normalize_query(query)}"
+    return key if limit is None else f"{key}#{limit}"
+
+
+def _invocation_log(tool_context: ToolContext) -> dict:
+    """Return this invocation's log, starting a fresh one when the id changes."""
+    log = tool_context.state.get(_STATE_KEY)
+    if not isinstance(log, dict) or log.get("invocation_id") != tool_context.invocation_id:
+        log = {"invocation_id": tool_context.invocation_id, "queries": []}
+    return log
+
+
+def is_duplicate_query(
+    tool_context: Optional[ToolContext],
+    endpoint: str,
+    query: str,
+    limit: Optional[int] = None,
+) -> bool:
+    """Return whether a query already succeeded in the current invocation.
+
+    The log lives in session state and is reset whenever the invocation id
+    changes, so re-running an approved plan still hits the APIs.
+
+    Args:
+        tool_context: The ADK tool context, or None when called outside ADK.
+        endpoint: A short identifier for the API being queried.
+        query: The query about to be executed.
+        limit: The number of results requested, if the API takes one; asking
+            for a different count is not a duplicate.
+
+    Returns:
+        True if the same query was recorded earlier in this invocation.
+    """
+    if tool_context is None:
+        return False
+    return _query_key(endpoint, query, limit) in _invocation_log(tool_context)["queries"]
+
+
+def record_query(
+    tool_context: Optional[ToolContext],
+    endpoint: str,
+    query: str,
+    limit: Optional[int] = None,
+) -> None:
+    """Record a query whose results were returned successfully.
+
+    Args:
+        tool_context: The ADK tool context, or None when called outside ADK.
+        endpoint: A short identifier for the API being queried.
+        query: The query that was executed.
+        limit: The number of results requested, as passed to
+            ``is_duplicate_query``.
+    """
+    if tool_context is None:
+        return
+
+    log = _invocation_log(tool_context)
+    key = _query_key(endpoint, query, limit)
+    if key in log["queries"]:
+        return
+
+    # Reassign rather than mutate so ADK records the state delta.
+    tool_context.state[_STATE_KEY] = {
+        "invocation_id": log["invocation_id"],
+        "queries": [*log["queries"], key],
+    }
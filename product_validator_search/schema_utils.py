@@ -0,0 +1,42 @@
+"""Import-time JSON schema generation for structured-output models.
+
+When an agent sets ``output_schema``, google-genai converts the model into a
+response schema on every request by calling ``model_json_schema()``. Pydantic
+regenerates that schema on each call. ``freeze_json_schema`` builds it once
+at import and returns copies from then on.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=type[BaseModel])
+
+
+def freeze_json_schema(model: ModelT) -> ModelT:
+    """Class decorator that precomputes a model's default JSON schema.
+
+    Calls with non-default arguments fall through to pydantic. Callers get
+    a deep copy because google-genai rewrites the schema dict in place.
+
+    Args:
+        model: The pydantic model class.
+
+    Returns:
+        The same class, with ``model_json_schema`` served from the
+        precomputed schema.
+    """
+    model.model_rebuild()
+    frozen = model.model_json_schema()
+    generate = model.model_json_schema
+
+    def model_json_schema(cls: type[BaseModel], *args: Any, **kwargs: Any) -> dict[str, Any]:
+        if args or kwargs or cls is not model:
+            return generate.__func__(cls, *args, **kwargs)
+        return copy.deepcopy(frozen)
+
+    model.model_json_schema = classmethod(model_json_schema)  # type: ignore[method-assign]
+    return model
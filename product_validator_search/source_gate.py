@@ -0,0 +1,68 @@
+"""Deterministic checks against the research plan's selected sources.
+
+Researcher prompts tell the model to skip sources the plan did not select,
+but a prompt can misfire. Tools use ``is_source_selected`` and source agents
+use ``skip_unless_selected`` to enforce the selection in code, so an
+unselected source costs no API calls and no model calls.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+SKIPPED_REPORT = "Source not selected — skipped."
+
+
+def is_source_selected(context: Optional[CallbackContext], source: str) -> bool:
+    """Return whether the current research plan selects `source`.
+
+    Only an explicit plan that omits the source counts as unselected; with no
+    context or no plan yet (e.g. a tool called directly), the source is
+    treated as selected.
+
+    Args:
+        context: The ADK tool or callback context, or None outside ADK.
+        source: A source name from the plan's `selected_sources` vocabulary.
+
+    Returns:
+        False if the plan's `selected_sources` is present and excludes the
+        source, True otherwise.
+    """
+    if context is None:
+        return True
+
+    plan = context.state.get("research_plan")
+    if not isinstance(plan, dict):
+        return True
+    selected = plan.get("selected_sources")
+    if not isinstance(selected, list):
+        return True
+    return source in selected
+
+
+def skip_unless_selected(
+    source: str,
+) -> Callable[[CallbackContext], Optional[types.Content]]:
+    """Build a before-agent callback that skips an unselected source's agent.
+
+    When the plan omits the source, the callback records the skip marker
+    under `<source>_raw_report` and returns it as the agent's reply, so ADK
+    never runs the agent or its sub-agents.
+
+    Args:
+        source: The source name, as used in `selected_sources`.
+
+    Returns:
+        A callback suitable for `before_agent_callback`.
+    """
+
+    def _callback(callback_context: CallbackContext) -> Optional[types.Content]:
+        if is_source_selected(callback_context, source):
+            return None
+        callback_context.state[f"{source}_raw_report"] = SKIPPED_REPORT
+        return types.Content(role="model", parts=[types.Part(text=SKIPPED_REPORT)])
+
+    return _callback
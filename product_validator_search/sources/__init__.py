@@ -1,13 +1,54 @@
-from .hackernews import hackernews_agent, HackerNewsValidation
-from .openalex import openalex_agent, OpenAlexValidation
-from .google_trends import google_trends_agent, GoogleTrendsValidation
-from .reddit import reddit_agent, RedditValidation
-from .github import github_agent, GitHubValidation
-from .brave_search import brave_search_agent, BraveSearchValidation
-from .competitors import competitors_agent, CompetitorValidation
-from .review_sites import review_sites_agent, ReviewSitesValidation
-from .jobs_signal import jobs_signal_agent, JobsSignalValidation
-from .seo_intent import seo_intent_agent, SeoIntentValidation
+"""Source research agents and their validation schemas.
+
+Exports resolve lazily: importing one tool module, such as
+`sources.openalex.search_tool`, does not construct every source's agents.
+Agents are built the first time they are accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .hackernews import hackernews_agent, HackerNewsValidation
+    from .openalex import openalex_agent, OpenAlexValidation
+    from .google_trends import google_trends_agent, GoogleTrendsValidation
+    from .reddit import reddit_agent, RedditValidation
+    from .github import github_agent, GitHubValidation
+    from .brave_search import brave_search_agent, BraveSearchValidation
+    from .competitors import competitors_agent, CompetitorValidation
+    from .review_sites import review_sites_agent, ReviewSitesValidation
+    from .jobs_signal import jobs_signal_agent, JobsSignalValidation
+    from .seo_intent import seo_intent_agent, SeoIntentValidation
+    from .multi_source_validator import multi_source_validator, MultiSourceValidation
+
+# Exported name -> submodule defining it.
+_EXPORTS = {
+    "hackernews_agent": ".hackernews",
+    "HackerNewsValidation": ".hackernews",
+    "openalex_agent": ".openalex",
+    "OpenAlexValidation": ".openalex",
+    "google_trends_agent": ".google_trends",
+    "GoogleTrendsValidation": ".google_trends",
+    "reddit_agent": ".reddit",
+    "RedditValidation": ".reddit",
+    "github_agent": ".github",
+    "GitHubValidation": ".github",
+    "brave_search_agent": ".brave_search",
+    "BraveSearchValidation": ".brave_search",
+    "competitors_agent": ".competitors",
+    "CompetitorValidation": ".competitors",
+    "review_sites_agent": ".review_sites",
+    "ReviewSitesValidation": ".review_sites",
+    "jobs_signal_agent": ".jobs_signal",
+    "JobsSignalValidation": ".jobs_signal",
+    "seo_intent_agent": ".seo_intent",
+    "SeoIntentValidation": ".seo_intent",
+    "multi_source_validator": ".multi_source_validator",
+    "MultiSourceValidation": ".multi_source_validator",
+}
 
 __all__ = [
     "hackernews_agent",
@@ -30,4 +71,9 @@ __all__ = [
     "JobsSignalValidation",
     "seo_intent_agent",
     "SeoIntentValidation",
+    "multi_source_validator",
+    "MultiSourceValidation",
 ]
+
+
+lazy_exports(__name__, _EXPORTS)
@@ -11,9 +11,11 @@ from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
 from .search_tool import search_brave
 
 
+@freeze_json_schema
 class BraveSearchValidation(BaseModel):
     """Structured output produced by the Brave Search validator agent."""
 
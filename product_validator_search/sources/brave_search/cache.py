@@ -0,0 +1,18 @@
+"""Process-wide cache for Brave web searches.
+
+The review-site and SEO-intent tools expand keywords into many templated
+queries, and the same (query, num_results) pairs recur across refinement
+rounds and between the two researchers. Routing them through
+``cached_search_brave`` serves repeats from memory and coalesces concurrent
+identical requests into one API call, saving Brave quota.
+"""
+
+from __future__ import annotations
+
+from ...ttl_cache import ttl_cache
+from .search_tool import search_brave
+
+# Errors (missing key, throttling that outlived retries) are not cached.
+cached_search_brave = ttl_cache(
+    maxsize=1024, ttl=600.0, cache_if=lambda response: not response.get("error")
+)(search_brave)
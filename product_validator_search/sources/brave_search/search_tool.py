@@ -6,16 +6,42 @@ Provides ADK-compatible tool functions:
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import Any
-import httpx
+
+import orjson
 from dotenv import load_dotenv
 
+from ...http_utils import get_client, get_semaphore, retry_transient
+
 _BRAVE_SEARCH_API_URL = "https://api.search.brave.com/res/v1/web/search"
 _TIMEOUT = 10.0
 
 
-def search_brave(query: str, num_results: int = 10) -> dict[str, Any]:
+@functools.cache
+def _load_env() -> None:
+    """Load `.env` into the environment once per process.
+
+    `load_dotenv` searches parent directories and re-parses the file, which
+    is wasted work on every query once the key is in `os.environ`.
+    """
+    load_dotenv()
+
+
+@retry_transient
+async def _get_results(params: dict[str, Any], headers: dict[str, str]) -> dict[str, Any]:
+    """GET the Brave web-search endpoint, retrying throttling and transient failures."""
+    client = await get_client()
+    async with get_semaphore("brave"):
+        r = await client.get(
+            _BRAVE_SEARCH_API_URL, params=params, headers=headers, timeout=_TIMEOUT
+        )
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+
+async def search_brave(query: str, num_results: int = 10) -> dict[str, Any]:
     """Search the web using Brave Search.
 
     Args:
@@ -26,7 +52,7 @@ def search_brave(query: str, num_results: int = 10) -> dict[str, Any]:
         A dict with 'query' and 'results' — a list of search result dicts.
     """
     # Ensure env vars are loaded from .env if present
-    load_dotenv()
+    _load_env()
 
     api_key = os.environ.get("BRAVE_SEARCH_API_KEY")
     if not api_key:
@@ -38,14 +64,7 @@ def search_brave(query: str, num_results: int = 10) -> dict[str, Any]:
     }
 
     try:
-        r = httpx.get(
-            _BRAVE_SEARCH_API_URL,
-            params={"q": query, "count": num_results},
-            headers=headers,
-            timeout=_TIMEOUT,
-        )
-        r.raise_for_status()
-        data = r.json()
+        data = await _get_results({"q": query, "count": num_results}, headers)
     except Exception as e:
         return {"query": query, "error": str(e), "results": []}
 
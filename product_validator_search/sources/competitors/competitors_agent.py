@@ -12,9 +12,11 @@ from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
 from ..brave_search.search_tool import search_brave
 
 
+@freeze_json_schema
 class CompetitorValidation(BaseModel):
     """Structured output produced by the Competitor Scout validator agent."""
 
@@ -11,9 +11,11 @@ from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
 from .search_tool import search_github
 
 
+@freeze_json_schema
 class GitHubValidation(BaseModel):
     """Structured output produced by the GitHub validator agent."""
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 import httpx
+import orjson
 
 _GITHUB_BASE = "https://api.github.com"
 _TIMEOUT = 10.0
@@ -31,7 +32,7 @@ def search_github(query: str, num_results: int = 5) -> dict[str, Any]:
             timeout=_TIMEOUT,
         )
         r.raise_for_status()
-        data = r.json()
+        data = orjson.loads(r.content)
     except Exception as e:
         return {"query": query, "error": str(e), "repositories": []}
 
@@ -15,6 +15,7 @@ from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
 from .search_tool import get_trends_interest_over_time, get_trends_related_queries
 
 # ---------------------------------------------------------------------------
@@ -22,6 +23,7 @@ from .search_tool import get_trends_interest_over_time, get_trends_related_queri
 # ---------------------------------------------------------------------------
 
 
+@freeze_json_schema
 class GoogleTrendsValidation(BaseModel):
     """Structured output produced by the validator agent."""
 
@@ -1,11 +1,11 @@
 """Hacker News research agent.
 
-A SequentialAgent that:
-  1. hackernews_researcher — searches HN for relevant keywords, selects the
-     top 5 posts, fetches their comment trees, and composes a raw research
-     report into session state.
-  2. hackernews_validator — a critic model that validates and synthesizes the
-     raw report into structured findings (signal score, recommendation, etc.).
+A SequentialAgent that runs hackernews_researcher, which searches HN for
+relevant keywords, selects the top 5 posts, fetches their comment trees, and
+composes a raw research report into session state.
+
+Validation into `HackerNewsValidation` is batched with the jobs-signal source
+in `sources/multi_source_validator.py`.
 """
 
 from __future__ import annotations
@@ -13,7 +13,7 @@ from __future__ import annotations
 from typing import Literal
 
 from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...config import config
 from .search_tool import get_hackernews_comments, search_hackernews
@@ -24,22 +24,24 @@ from .search_tool import get_hackernews_comments, search_hackernews
 
 
 class HackerNewsValidation(BaseModel):
-    """Structured output produced by the validator agent."""
+    """Structured Hacker News output produced by the multi-source validator."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
     confidence: Literal["low", "medium", "high"]
     evidence_strength: int = Field(default=0, ge=0, le=100)
     evidence_quality: Literal["weak", "moderate", "strong"] = "weak"
-    material_supporting_evidence: list[str] = Field(default_factory=list)
-    weak_supporting_evidence: list[str] = Field(default_factory=list)
-    material_contradictions: list[str] = Field(default_factory=list)
-    weak_contradictions: list[str] = Field(default_factory=list)
-    deep_dive_actions_taken: list[str] = Field(default_factory=list)
-    evidence_gaps: list[str] = Field(default_factory=list)
-    key_findings: list[str] = Field(default_factory=list)
-    pain_points: list[str] = Field(default_factory=list)
-    competitors_mentioned: list[str] = Field(default_factory=list)
+    material_supporting_evidence: tuple[str, ...] = ()
+    weak_supporting_evidence: tuple[str, ...] = ()
+    material_contradictions: tuple[str, ...] = ()
+    weak_contradictions: tuple[str, ...] = ()
+    deep_dive_actions_taken: tuple[str, ...] = ()
+    evidence_gaps: tuple[str, ...] = ()
+    key_findings: tuple[str, ...] = ()
+    pain_points: tuple[str, ...] = ()
+    competitors_mentioned: tuple[str, ...] = ()
     community_sentiment: str = ""
     reasoning: str = ""
 
@@ -92,7 +94,8 @@ It contains:
 5. **Fetch comments** — For each of the 5 selected posts, call
    `get_hackernews_comments` with its `objectID` to get the full comment tree.
    In refinement rounds, increase `max_depth` and/or `comment_limit` when
-   needed to verify high-impact claims.
+   needed to verify high-impact claims; if a result comes back with
+   `truncated: true`, raise `max_bytes` / `max_scanned` as well.
 
 6. **Compose report** — Write a detailed raw research report that includes:
    - Each post's title, URL, points
@@ -123,68 +126,22 @@ It contains:
      - weak = not sufficiently corroborated; cannot drive recommendation alone.
    - Treat social low-signal reactions (emoji jokes, one-off comments) as weak warnings unless corroborated.
 
-Save your full report as plain text. This will be passed to a validator agent
-for synthesis.
+Save your full report as plain text. This will be passed to the shared
+multi-source validator for synthesis.
 """,
     tools=[search_hackernews, get_hackernews_comments],
     output_key="hackernews_raw_report",
 )
 
 # ---------------------------------------------------------------------------
-# Sub-agent 2: Validator / Synthesizer
-# ---------------------------------------------------------------------------
-
-hackernews_validator = LlmAgent(
-    name="hackernews_validator",
-    model=config.critic_model,
-    description="Validates and synthesizes a raw Hacker News research report.",
-    instruction="""\
-You are a critical product-validation analyst. You will receive a raw research
-report from Hacker News (in state key `hackernews_raw_report`).
-
-Your job is to evaluate the evidence and produce a structured assessment:
-
-1. **Key findings** — The most important signals from the posts and comments.
-2. **Pain points** — Real user pain points mentioned in discussions.
-3. **Competitors mentioned** — Any products, tools, or projects that HN users
-   reference as existing solutions.
-4. **Community sentiment** — Overall tone: enthusiastic, skeptical, mixed, etc.
-5. **Signal score** (0-100) — How strong is the market signal based on
-   this HN evidence alone?  0 = no signal, 100 = overwhelming demand.
-6. **Confidence** — low / medium / high based on volume and quality of data.
-7. **Recommendation** — proceed / pivot / abandon based on the evidence.
-8. **Reasoning** — A concise explanation of your assessment.
-
-Be rigorous. Do not inflate scores. If the data is thin or ambiguous, say so.
-
-Evidence reliability rules:
-- Populate `material_supporting_evidence`, `weak_supporting_evidence`, `material_contradictions`, `weak_contradictions`, `deep_dive_actions_taken`, and `evidence_gaps`.
-- Use moderate corroboration for BOTH support and contradiction:
-  - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
-  - weak = not sufficiently corroborated.
-- Weak evidence cannot drive recommendation changes alone.
-- One-off social low-signal reactions are weak warnings unless corroborated.
-
-Recommendation rules:
-- Default to skeptical. Curiosity in comments is not product demand.
-- Use `proceed` only if multiple threads show repeated pain, clear urgency, and dissatisfaction with current options.
-- Use `pivot` for partial demand signals with weak fit, wrong audience, or unclear differentiation.
-- Use `abandon` when sentiment is mostly dismissive, problem urgency is low, or alternatives are "good enough."
-""",
-    output_schema=HackerNewsValidation,
-    output_key="hackernews_validation",
-)
-
-# ---------------------------------------------------------------------------
-# Composed agent: Researcher → Validator
+# Composed agent: Researcher (validated by multi_source_validator)
 # ---------------------------------------------------------------------------
 
 hackernews_agent = SequentialAgent(
     name="hackernews_agent",
     description=(
         "Researches a product idea on Hacker News by searching for relevant "
-        "posts, fetching comment threads, and validating the findings through "
-        "a critic model."
+        "posts and fetching comment threads."
     ),
-    sub_agents=[hackernews_researcher, hackernews_validator],
+    sub_agents=[hackernews_researcher],
 )
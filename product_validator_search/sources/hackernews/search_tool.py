@@ -7,15 +7,98 @@ Provides two ADK-compatible tool functions:
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import sys
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Iterable, Iterator, Optional
 
-import httpx
+import ijson
+import orjson
+from google.adk.tools.tool_context import ToolContext
+
+from ...http_utils import get_client, get_semaphore, retry_transient
+from ...query_dedupe import is_duplicate_query, record_query
 
 _ALGOLIA_BASE = "https://hn.algolia.com/api/v1"
 _TIMEOUT = 15.0
+_HN_ITEM_URL = "https://news.ycombinator.com/item?id="
+# Only the fields _iter_hits reads; Algolia otherwise ships highlights and tags.
+_HIT_ATTRIBUTES = "objectID,title,story_title,url,points,num_comments,author"
+
+# Story-level fields read from the item stream. Algolia emits item keys in
+# alphabetical order, so these arrive after the (potentially huge) children.
+_ITEM_FIELDS = frozenset({"title", "url", "points"})
+_SCALAR_EVENTS = frozenset({"string", "number"})
+
+# Default flatten budget. The researcher's context only holds so much, so
+# there is no point walking megabytes of comments on a 10k-comment thread.
+_MAX_COMMENT_BYTES = 262_144
+_MAX_COMMENTS_SCANNED = 5_000
+
+
+@dataclass
+class Comment:
+    """One flattened HN comment.
+
+    Slotted to keep large threads cheap; pydantic and orjson both serialize
+    dataclasses natively, so tool responses reach the model as plain JSON.
+    """
+
+    # Declared by hand: `dataclass(slots=True)` needs Python 3.10.
+    __slots__ = ("author", "text", "depth")
+
+    author: str
+    text: str
+    depth: int
+
+
+class _FlattenBudget:
+    """Running totals shared across every thread flattened for one item."""
+
+    __slots__ = ("max_bytes", "max_scanned", "bytes_used", "scanned")
+
+    def __init__(self, max_bytes: int, max_scanned: int) -> None:
+        self.max_bytes = max_bytes
+        self.max_scanned = max_scanned
+        self.bytes_used = 0
+        self.scanned = 0
 
+    @property
+    def exhausted(self) -> bool:
+        return self.bytes_used >= self.max_bytes or self.scanned >= self.max_scanned
 
-def search_hackernews(query: str, num_results: int = 20) -> dict[str, Any]:
+
+def _iter_hits(hits: Iterable[dict]) -> Iterator[dict[str, Any]]:
+    """Yield the minimal story dict for each hit that has a title."""
+    for hit in hits:
+        title = hit.get("title") or hit.get("story_title")
+        if not title:
+            continue
+        object_id = hit.get("objectID", "")
+        yield {
+            "objectID": object_id,
+            "title": title,
+            "url": hit.get("url") or f"{_HN_ITEM_URL}{object_id}",
+            "points": hit.get("points", 0),
+            "num_comments": hit.get("num_comments", 0),
+            "author": hit.get("author", ""),
+        }
+
+
+@retry_transient
+async def _fetch_search(params: dict[str, Any]) -> bytes:
+    """GET /search under the HN concurrency cap, retrying transient failures."""
+    client = await get_client()
+    async with get_semaphore("hackernews"):
+        r = await client.get(f"{_ALGOLIA_BASE}/search", params=params, timeout=_TIMEOUT)
+        r.raise_for_status()
+        return r.content
+
+
+async def search_hackernews(
+    query: str,
+    num_results: int = 20,
+    tool_context: Optional[ToolContext] = None,
+) -> dict[str, Any]:
     """Search Hacker News stories by keyword.
 
     Args:
@@ -24,67 +107,165 @@ def search_hackernews(query: str, num_results: int = 20) -> dict[str, Any]:
 
     Returns:
         A dict with 'query' and 'hits' — a list of story dicts, each containing
-        objectID, title, url, points, num_comments, and author.
+        objectID, title, url, points, num_comments, and author. A query that
+        already succeeded in this run with the same `num_results` returns no
+        hits and 'duplicate': True.
     """
-    r = httpx.get(
-        f"{_ALGOLIA_BASE}/search",
-        params={
+    if is_duplicate_query(tool_context, "hackernews", query, num_results):
+        return {
+            "query": query,
+            "total_hits": 0,
+            "hits": [],
+            "duplicate": True,
+            "note": "Query already executed in this run; reuse the earlier results.",
+        }
+
+    body = await _fetch_search(
+        {
             "query": query,
             "tags": "story",
             "hitsPerPage": num_results,
-        },
-        timeout=_TIMEOUT,
+            "attributesToRetrieve": _HIT_ATTRIBUTES,
+            "attributesToHighlight": "",
+        }
     )
-    r.raise_for_status()
-    payload = r.json()
-
-    hits = []
-    for hit in payload.get("hits", []):
-        title = hit.get("title") or hit.get("story_title") or ""
-        if not title:
-            continue
-        hits.append(
-            {
-                "objectID": hit.get("objectID", ""),
-                "title": title,
-                "url": hit.get("url")
-                or f"https://news.ycombinator.com/item?id={hit.get('objectID', '')}",
-                "points": hit.get("points", 0),
-                "num_comments": hit.get("num_comments", 0),
-                "author": hit.get("author", ""),
-            }
-        )
+    payload = orjson.loads(body)
+    record_query(tool_context, "hackernews", query, num_results)
 
-    return {"query": query, "total_hits": payload.get("nbHits", 0), "hits": hits}
+    return {
+        "query": query,
+        "total_hits": payload.get("nbHits", 0),
+        "hits": list(_iter_hits(payload.get("hits", ()))),
+    }
 
 
 def _flatten_comments(
-    children: list[dict], max_depth: int = 3, _depth: int = 0
-) -> list[dict]:
-    """Recursively flatten the comment tree up to max_depth."""
-    flat: list[dict] = []
-    for child in children:
+    children: list[dict],
+    max_depth: int = 3,
+    budget: Optional[_FlattenBudget] = None,
+) -> list[Comment]:
+    """Flatten the comment tree depth-first up to max_depth.
+
+    Stops early once ``budget`` runs out of scanned nodes or comment bytes.
+    """
+    flat: list[Comment] = []
+    stack = [(child, 0) for child in reversed(children)]
+    while stack:
+        if budget is not None and budget.exhausted:
+            break
+        child, depth = stack.pop()
+        if budget is not None:
+            budget.scanned += 1
         if child.get("type") != "comment":
             continue
         text = child.get("text") or ""
         if not text:
             continue
-        flat.append(
-            {
-                "author": child.get("author", ""),
-                "text": text,
-                "depth": _depth,
-            }
-        )
-        if _depth < max_depth and child.get("children"):
-            flat.extend(_flatten_comments(child["children"], max_depth, _depth + 1))
+        flat.append(Comment(child.get("author", ""), text, depth))
+        if budget is not None:
+            budget.bytes_used += len(text.encode("utf-8"))
+        replies = child.get("children")
+        if depth < max_depth and replies:
+            stack.extend((reply, depth + 1) for reply in reversed(replies))
     return flat
 
 
-def get_hackernews_comments(
+async def _parse_item_stream(
+    chunks: AsyncIterable[bytes],
+    max_depth: int,
+    comment_limit: Optional[int],
+    budget: _FlattenBudget,
+) -> tuple[dict[str, Any], list[Comment]]:
+    """Incrementally parse an Algolia item, flattening one top-level thread at a time.
+
+    Only one top-level comment subtree is materialized at once, nodes nested
+    deeper than ``max_depth`` are never built, and once ``comment_limit``
+    comments are collected or ``budget`` is spent the remaining threads are
+    scanned but not built.
+
+    Returns:
+        A tuple of (story fields, flattened comments).
+    """
+    item: dict[str, Any] = {}
+    comments: list[Comment] = []
+    # Events under the children array of a node at max_depth are dropped.
+    too_deep = "children.item" + ".children.item" * max_depth + ".children"
+    builder: Optional[ijson.ObjectBuilder] = None
+
+    def handle(events: list) -> None:
+        nonlocal builder
+        for prefix, event, value in events:
+            if builder is not None:
+                if prefix == too_deep or prefix.startswith(too_deep + "."):
+                    continue
+                if event == "map_key":
+                    # The parser hands back a fresh str per key; interning
+                    # shares one object across every node in the thread so
+                    # _flatten_comments' lookups hit the identity fast path.
+                    value = sys.intern(value)
+                builder.event(event, value)
+                if prefix == "children.item" and event == "end_map":
+                    comments.extend(_flatten_comments([builder.value], max_depth, budget))
+                    builder = None
+            elif prefix == "children.item" and event == "start_map":
+                if budget.exhausted:
+                    continue
+                if comment_limit is None or len(comments) < comment_limit:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+            elif prefix in _ITEM_FIELDS and event in _SCALAR_EVENTS:
+                item[prefix] = value
+        del events[:]
+
+    events = ijson.sendable_list()
+    coro = ijson.parse_coro(events)
+    async for chunk in chunks:
+        coro.send(chunk)
+        handle(events)
+    coro.close()
+    handle(events)
+
+    if comment_limit is not None:
+        comments = comments[:comment_limit]
+    return item, comments
+
+
+@retry_transient
+async def _fetch_item(
+    object_id: str,
+    max_depth: int,
+    comment_limit: Optional[int],
+    max_bytes: int,
+    max_scanned: int,
+) -> tuple[dict[str, Any], list[Comment], bool]:
+    """Stream and parse one item under the HN concurrency cap, retrying transient failures.
+
+    The flatten budget is created per attempt, so a retry after a stream
+    that failed partway starts with the full budget.
+
+    Returns:
+        A tuple of (story fields, flattened comments, whether the budget
+        cut the thread short).
+    """
+    budget = _FlattenBudget(max_bytes=max_bytes, max_scanned=max_scanned)
+    client = await get_client()
+    async with get_semaphore("hackernews"):
+        async with client.stream(
+            "GET", f"{_ALGOLIA_BASE}/items/{object_id}", timeout=_TIMEOUT
+        ) as r:
+            r.raise_for_status()
+            item, comments = await _parse_item_stream(
+                r.aiter_bytes(), max_depth, comment_limit, budget
+            )
+    return item, comments, budget.exhausted
+
+
+async def get_hackernews_comments(
     object_id: str,
     max_depth: int = 3,
     comment_limit: Optional[int] = None,
+    max_bytes: int = _MAX_COMMENT_BYTES,
+    max_scanned: int = _MAX_COMMENTS_SCANNED,
 ) -> dict[str, Any]:
     """Fetch a Hacker News post and its full comment tree.
 
@@ -92,26 +273,28 @@ def get_hackernews_comments(
         object_id: The HN item ID (objectID from search results).
         max_depth: Maximum comment nesting depth to flatten (default 3).
         comment_limit: Optional cap on flattened comments returned.
+        max_bytes: Stop flattening after this many UTF-8 bytes of comment
+            text (default 262144).
+        max_scanned: Stop flattening after visiting this many comment nodes
+            (default 5000).
 
     Returns:
         A dict with 'title', 'url', 'points', and 'comments' — a flat list of
-        comment dicts with author, text, and depth.
+        `Comment` dataclasses (author, text, depth), not dicts; they
+        serialize to the same JSON objects. 'truncated' is True when the
+        byte or scan budget cut the thread short.
     """
-    r = httpx.get(
-        f"{_ALGOLIA_BASE}/items/{object_id}",
-        timeout=_TIMEOUT,
+    if comment_limit is not None and comment_limit <= 0:
+        comment_limit = None
+    item, comments, truncated = await _fetch_item(
+        object_id, max_depth, comment_limit, max_bytes, max_scanned
     )
-    r.raise_for_status()
-    item = r.json()
-
-    comments = _flatten_comments(item.get("children", []), max_depth=max_depth)
-    if comment_limit is not None and comment_limit > 0:
-        comments = comments[:comment_limit]
 
     return {
         "objectID": object_id,
         "title": item.get("title", ""),
-        "url": item.get("url") or f"https://news.ycombinator.com/item?id={object_id}",
+        "url": item.get("url") or f"{_HN_ITEM_URL}{object_id}",
         "points": item.get("points", 0),
         "comments": comments,
+        "truncated": truncated,
     }
@@ -1,6 +1,8 @@
 """Jobs signal research agent.
 
 A SequentialAgent that researches hiring demand related to the problem space.
+Validation into `JobsSignalValidation` is batched with the Hacker News source
+in `sources/multi_source_validator.py`.
 """
 
 from __future__ import annotations
@@ -8,30 +10,32 @@ from __future__ import annotations
 from typing import Literal
 
 from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...config import config
 from .search_tool import search_jobs_signal
 
 
 class JobsSignalValidation(BaseModel):
-    """Structured output produced by the jobs-signal validator agent."""
+    """Structured jobs-signal output produced by the multi-source validator."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
     confidence: Literal["low", "medium", "high"]
     evidence_strength: int = Field(default=0, ge=0, le=100)
     evidence_quality: Literal["weak", "moderate", "strong"] = "weak"
-    material_supporting_evidence: list[str] = Field(default_factory=list)
-    weak_supporting_evidence: list[str] = Field(default_factory=list)
-    material_contradictions: list[str] = Field(default_factory=list)
-    weak_contradictions: list[str] = Field(default_factory=list)
-    deep_dive_actions_taken: list[str] = Field(default_factory=list)
-    evidence_gaps: list[str] = Field(default_factory=list)
+    material_supporting_evidence: tuple[str, ...] = ()
+    weak_supporting_evidence: tuple[str, ...] = ()
+    material_contradictions: tuple[str, ...] = ()
+    weak_contradictions: tuple[str, ...] = ()
+    deep_dive_actions_taken: tuple[str, ...] = ()
+    evidence_gaps: tuple[str, ...] = ()
     hiring_velocity_signal: str = ""
-    roles_related_to_problem: list[str] = Field(default_factory=list)
-    enterprise_adoption_clues: list[str] = Field(default_factory=list)
-    key_findings: list[str] = Field(default_factory=list)
+    roles_related_to_problem: tuple[str, ...] = ()
+    enterprise_adoption_clues: tuple[str, ...] = ()
+    key_findings: tuple[str, ...] = ()
     reasoning: str = ""
 
 
@@ -92,34 +96,8 @@ Save to `jobs_signal_raw_report`.
     output_key="jobs_signal_raw_report",
 )
 
-jobs_signal_validator = LlmAgent(
-    name="jobs_signal_validator",
-    model=config.critic_model,
-    description="Validates and synthesizes jobs-market signals.",
-    instruction="""\
-You are a critical product analyst evaluating jobs-market evidence.
-Read `jobs_signal_raw_report` and output `JobsSignalValidation`.
-
-Evidence reliability rules:
-- Populate `material_supporting_evidence`, `weak_supporting_evidence`, `material_contradictions`, `weak_contradictions`, `deep_dive_actions_taken`, and `evidence_gaps`.
-- Use moderate corroboration for BOTH support and contradiction:
-  - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
-  - weak = not sufficiently corroborated.
-- Weak evidence cannot drive recommendation changes alone.
-- One-off social low-signal reactions are weak warnings unless corroborated.
-
-Recommendation rules:
-- Default to skeptical: job postings are a proxy, not direct purchase intent.
-- Use `proceed` only when repeated hiring patterns indicate sustained budget and urgency.
-- Use `pivot` when demand exists but appears concentrated in a different segment/workflow.
-- Use `abandon` when hiring signals are sparse, stale, or unrelated to the concept.
-""",
-    output_schema=JobsSignalValidation,
-    output_key="jobs_signal_validation",
-)
-
 jobs_signal_agent = SequentialAgent(
     name="jobs_signal_agent",
     description="Researches hiring demand as a proxy for commercial urgency.",
-    sub_agents=[jobs_signal_researcher, jobs_signal_validator],
+    sub_agents=[jobs_signal_researcher],
 )
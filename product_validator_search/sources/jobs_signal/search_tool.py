@@ -2,40 +2,62 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
-from ..brave_search.search_tool import search_brave
+from google.adk.tools.tool_context import ToolContext
 
+from ...query_dedupe import is_duplicate_query, normalize_query, record_query
+from ..brave_search.search_tool import search_brave
 
-def search_jobs_signal(keywords: list[str], num_results: int = 8) -> dict[str, Any]:
-    """Search hiring pages for demand and budget proxies."""
-    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:5]
+_QUERY_TEMPLATES = (
+    'site:linkedin.com/jobs "{kw}"',
+    'site:indeed.com "{kw}" "job"',
+    '"{kw}" "hiring" "product manager"',
+    '"{kw}" "implementation" "enterprise"',
+)
+_MAX_KEYWORDS = 5
+_MAX_QUERIES = 10
+
+
+async def search_jobs_signal(
+    keywords: list[str],
+    num_results: int = 8,
+    tool_context: Optional[ToolContext] = None,
+) -> dict[str, Any]:
+    """Search hiring pages for demand and budget proxies.
+
+    Queries that already succeeded earlier in the same run with the same
+    `num_results` are not re-sent and are listed under 'skipped_duplicates';
+    queries that returned an error are retried on the next call.
+    """
+    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:_MAX_KEYWORDS]
     if not sanitized:
         return {"queries": [], "results_by_query": [], "errors": ["No keywords provided."]}
 
-    queries: list[str] = []
-    for kw in sanitized:
-        queries.extend(
-            [
-                f'site:linkedin.com/jobs "{kw}"',
-                f'site:indeed.com "{kw}" "job"',
-                f'"{kw}" "hiring" "product manager"',
-                f'"{kw}" "implementation" "enterprise"',
-            ]
-        )
-
-    deduped_queries = list(dict.fromkeys(queries))[:10]
+    queries = [t.format(kw=kw) for kw in sanitized for t in _QUERY_TEMPLATES]
+
+    unique_queries: dict[str, str] = {}
+    for query in queries:
+        unique_queries.setdefault(normalize_query(query), query)
+    deduped_queries = list(unique_queries.values())[:_MAX_QUERIES]
     results_by_query: list[dict[str, Any]] = []
     errors: list[str] = []
+    skipped_duplicates: list[str] = []
 
     for query in deduped_queries:
-        response = search_brave(query=query, num_results=num_results)
+        if is_duplicate_query(tool_context, "brave", query, num_results):
+            skipped_duplicates.append(query)
+            continue
+        response = await search_brave(query=query, num_results=num_results)
         if response.get("error"):
             errors.append(f'{query}: {response["error"]}')
+        else:
+            record_query(tool_context, "brave", query, num_results)
         results_by_query.append(response)
 
     return {
         "queries": deduped_queries,
         "results_by_query": results_by_query,
         "errors": errors,
+        "skipped_duplicates": skipped_duplicates,
     }
@@ -0,0 +1,139 @@
+"""Shared validator for the Hacker News and jobs-signal sources.
+
+Instead of one critic LLM call per source, a single LlmAgent reads both raw
+reports and emits one structured object holding each source's validation.
+An after-agent callback then fans the result out to the per-source state
+keys (`hackernews_validation`, `jobs_signal_validation`) that the final
+validator already consumes. A before-agent gate skips the LLM call entirely
+when the research plan selects neither source.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from pydantic import BaseModel, ConfigDict
+
+from ..config import config
+from ..schema_utils import freeze_json_schema
+from ..source_gate import SKIPPED_REPORT, is_source_selected
+from .hackernews import HackerNewsValidation
+from .jobs_signal import JobsSignalValidation
+
+# ---------------------------------------------------------------------------
+# Structured output schema for the combined validator
+# ---------------------------------------------------------------------------
+
+
+@freeze_json_schema
+class MultiSourceValidation(BaseModel):
+    """Structured output holding one validation per batched source."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    hackernews: HackerNewsValidation
+    jobs_signal: JobsSignalValidation
+
+
+# ---------------------------------------------------------------------------
+# Callbacks — skip unselected batches, split the combined output
+# ---------------------------------------------------------------------------
+
+
+def _skip_unless_any_selected(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Skip the combined validator when the plan selects none of its sources.
+
+    Mirrors `source_gate.skip_unless_selected`: each batched source gets the
+    skip marker under `<source>_raw_report`, and the marker is returned as
+    the agent's reply so ADK never calls the model.
+    """
+    sources = MultiSourceValidation.model_fields
+    if any(is_source_selected(callback_context, source) for source in sources):
+        return None
+    for source in sources:
+        callback_context.state[f"{source}_raw_report"] = SKIPPED_REPORT
+    return types.Content(role="model", parts=[types.Part(text=SKIPPED_REPORT)])
+
+
+def _split_validation_callback(callback_context: CallbackContext) -> None:
+    """Copy each source's section to its `<source>_validation` state key."""
+    combined = callback_context.state.get("multi_source_validation")
+    if not isinstance(combined, dict):
+        return None
+
+    for source in MultiSourceValidation.model_fields:
+        if source in combined:
+            callback_context.state[f"{source}_validation"] = combined[source]
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Combined validator / synthesizer
+# ---------------------------------------------------------------------------
+
+multi_source_validator = LlmAgent(
+    name="multi_source_validator",
+    model=config.critic_model,
+    description="Validates and synthesizes the Hacker News and jobs-signal raw reports in one pass.",
+    instruction="""\
+You are a critical product-validation analyst. You will receive two raw
+research reports from session state:
+- `hackernews_raw_report` — Hacker News posts and comment threads
+- `jobs_signal_raw_report` — public job postings used as a demand proxy
+
+Evaluate each report independently and output `MultiSourceValidation`, with
+one section per source (`hackernews`, `jobs_signal`). Never let evidence
+from one report leak into the other section.
+
+If a report is missing or says the source was not selected, fill that
+section with `signal_score` 0, `confidence` `low`, `recommendation`
+`abandon`, and explain in `reasoning` that the source was skipped.
+
+## `hackernews` section
+1. **Key findings** — The most important signals from the posts and comments.
+2. **Pain points** — Real user pain points mentioned in discussions.
+3. **Competitors mentioned** — Any products, tools, or projects that HN users
+   reference as existing solutions.
+4. **Community sentiment** — Overall tone: enthusiastic, skeptical, mixed, etc.
+5. **Signal score** (0-100) — How strong is the market signal based on
+   this HN evidence alone?  0 = no signal, 100 = overwhelming demand.
+6. **Confidence** — low / medium / high based on volume and quality of data.
+7. **Recommendation** — proceed / pivot / abandon based on the evidence.
+8. **Reasoning** — A concise explanation of your assessment.
+
+Hacker News recommendation rules:
+- Default to skeptical. Curiosity in comments is not product demand.
+- Use `proceed` only if multiple threads show repeated pain, clear urgency, and dissatisfaction with current options.
+- Use `pivot` for partial demand signals with weak fit, wrong audience, or unclear differentiation.
+- Use `abandon` when sentiment is mostly dismissive, problem urgency is low, or alternatives are "good enough."
+
+## `jobs_signal` section
+Assess hiring velocity, roles related to the problem, and enterprise
+adoption clues.
+
+Jobs-signal recommendation rules:
+- Default to skeptical: job postings are a proxy, not direct purchase intent.
+- Use `proceed` only when repeated hiring patterns indicate sustained budget and urgency.
+- Use `pivot` when demand exists but appears concentrated in a different segment/workflow.
+- Use `abandon` when hiring signals are sparse, stale, or unrelated to the concept.
+
+## Rules for both sections
+Be rigorous. Do not inflate scores. If the data is thin or ambiguous, say so.
+
+Evidence reliability rules:
+- Populate `material_supporting_evidence`, `weak_supporting_evidence`, `material_contradictions`, `weak_contradictions`, `deep_dive_actions_taken`, and `evidence_gaps`.
+- Use moderate corroboration for BOTH support and contradiction:
+  - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
+  - weak = not sufficiently corroborated.
+- Weak evidence cannot drive recommendation changes alone.
+- One-off social low-signal reactions are weak warnings unless corroborated.
+""",
+    output_schema=MultiSourceValidation,
+    output_key="multi_source_validation",
+    before_agent_callback=_skip_unless_any_selected,
+    after_agent_callback=_split_validation_callback,
+)
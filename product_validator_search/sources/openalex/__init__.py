@@ -1,3 +1,12 @@
-from .openalex_agent import openalex_agent, OpenAlexValidation
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ...lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .openalex_agent import openalex_agent, OpenAlexValidation
 
 __all__ = ["openalex_agent", "OpenAlexValidation"]
+
+lazy_exports(__name__, {name: ".openalex_agent" for name in __all__})
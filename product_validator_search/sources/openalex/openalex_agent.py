@@ -1,30 +1,36 @@
 """OpenAlex academic research agent.
 
-A SequentialAgent that:
-  1. openalex_researcher — searches OpenAlex for academic works relevant to a
-     product idea, selects the top 5 papers, fetches their full details
-     (abstracts, concepts, citation counts), and composes a raw research report.
-  2. openalex_validator — a critic model that validates and synthesizes the raw
-     report into structured findings for product validation.
+A single LlmAgent that searches OpenAlex along the validation and
+invalidation tracks, batch-fetches the top papers, and answers directly with
+a structured `OpenAlexValidation`: the research and the critic's assessment
+share one tool loop instead of a researcher → validator hand-off.
 """
 
 from __future__ import annotations
 
 from typing import Literal
 
-from google.adk.agents import LlmAgent, SequentialAgent
+from google.adk.agents import LlmAgent
 from pydantic import BaseModel, Field
 
 from ...config import config
-from .search_tool import get_openalex_work_details, search_openalex
+from ...schema_utils import freeze_json_schema
+from ...source_gate import skip_unless_selected
+from .search_tool import (
+    get_openalex_work_details,
+    get_openalex_works_batch,
+    search_openalex,
+    search_openalex_multi,
+)
 
 # ---------------------------------------------------------------------------
-# Structured output schema for the validator
+# Structured output schema
 # ---------------------------------------------------------------------------
 
 
+@freeze_json_schema
 class OpenAlexValidation(BaseModel):
-    """Structured output produced by the validator agent."""
+    """Structured output produced by the OpenAlex agent."""
 
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
@@ -48,33 +54,16 @@ class OpenAlexValidation(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Sub-agent 1: Researcher
+# Agent: research and assessment in one structured-output tool loop
 # ---------------------------------------------------------------------------
 
-openalex_researcher = LlmAgent(
-    name="openalex_researcher",
-    model=config.worker_model,
-    description="Searches OpenAlex for academic papers relevant to a product idea.",
-    instruction="""\
-You are an academic research specialist. Your job is to investigate the
-scholarly landscape around a product idea using OpenAlex.
-
-## Getting your inputs
-Read the `research_plan` from session state.
-Use `deep_dive_hypotheses` and `evidence_validation_rules` if present.
-It contains:
-- `product_idea` — the idea to validate
-- `selected_sources` — list of sources to use
-- `search_keywords` — suggested starting keywords
-- `validation_keywords` — keywords for supportive evidence
-- `invalidation_keywords` — keywords for disconfirming evidence
-- `research_focus` — what to focus on
-- `validation_focus` / `invalidation_focus` — focused directions per track
-
-**IMPORTANT:** If "openalex" is NOT in `selected_sources`, output
-"Source not selected — skipped." and stop. Do not call any tools.
+_STATIC_PREAMBLE = """\
+You are an academic research specialist and a critical product-validation
+analyst. Investigate the scholarly landscape around a product idea using
+OpenAlex, then assess the evidence yourself and answer with a structured
+`OpenAlexValidation`.
 
-## Steps (only if selected)
+## Research steps (only if selected — see Runtime Inputs below)
 
 1. **Generate dual-track queries** — Use `validation_keywords` and
    `invalidation_keywords` from the plan. If either is missing, fall back to
@@ -87,30 +76,36 @@ It contains:
    - Adjacent or competing approaches
    - Application areas
 
-2. **Validation track search** — Call `search_openalex` for at least
-   2 validation queries. Collect results.
-
-3. **Invalidation track search** — Call `search_openalex` for at least
-   2 invalidation queries to find prior-art saturation, practical blockers,
-   and low-readiness signals. Collect results.
-
-4. **Select top 5** — From all combined results, pick the 5 most relevant
-   works. Prioritize by: relevance to the product idea, citation count
-   (higher = more influential), and recency (prefer recent work showing
-   active research).
-
-5. **Fetch details** — For each of the 5 selected works, call
-   `get_openalex_work_details` with its `id` to get the full metadata
-   including the abstract.
-
-6. **Compose report** — Write a detailed raw research report covering:
-   - Each paper's title, year, citation count, abstract summary
-   - Key concepts and research themes
-   - Whether the research indicates an unsolved problem (opportunity) or
-     a well-established solution (competition risk)
-   - Signs of industry–academia crossover (commercial potential)
-   - Overall maturity of the research area
-   The raw report MUST include:
+2. **Search both tracks at once** — Call `search_openalex_multi` once with
+   at least 2 validation queries and at least 2 invalidation queries (the
+   latter looking for prior-art saturation, practical blockers, and
+   low-readiness signals). The tool runs every query concurrently, so
+   neither track waits on the other. Use `search_openalex` for single
+   follow-up queries in refinement rounds.
+
+3. **Select top works** — Search results arrive pre-ranked by citation
+   count and recency, trimmed to the top 5 per query. Trust that order: take
+   up to 5 works per track, skipping duplicates and works clearly irrelevant
+   to the product idea. Pass `auto_rank=false` only when a refinement round
+   needs the full relevance-ordered result list.
+
+4. **Fetch details** — Call `get_openalex_works_batch` once with the `id`s of
+   all selected works to get their full metadata including abstracts.
+   Use `get_openalex_work_details` only for a single follow-up work in a
+   refinement round. Raise `abstract_chars`, `concept_top`, or `author_top`
+   only when a refinement round needs more detail.
+
+5. **Adaptive refinement loop** — Before answering:
+   - Run up to 2 conditional refinement rounds.
+   - Trigger refinement when evidence is thin, conflicting, or high-impact on either side.
+   - In each round, create up to 4 targeted follow-up queries from observed claims/entities.
+   - Stop early when evidence is strong, convergent, and high-impact claims are resolved.
+
+6. **Organize the evidence** — For each selected paper note its title,
+   year, citation count, abstract summary, and key concepts, whether it
+   indicates an unsolved problem (opportunity) or a well-established
+   solution (competition risk), and any industry–academia crossover. Sort
+   the evidence into:
    - Supporting evidence
    - Disconfirming evidence
    - Contradictions
@@ -122,39 +117,18 @@ It contains:
    - Deep-dive actions taken
    - Evidence gaps
    - Provisional source verdict: `pass`, `warning`, or `fail`
+   These feed the structured fields below; state the provisional verdict
+   and the data quality gaps in `reasoning`.
 
-7. **Adaptive refinement loop** — Before finalizing the report:
-   - Run initial validation/invalidation probes first.
-   - Run up to 2 conditional refinement rounds.
-   - Trigger refinement when evidence is thin, conflicting, or high-impact on either side.
-   - In each round, create up to 4 targeted follow-up queries from observed claims/entities.
-   - Stop early when evidence is strong, convergent, and high-impact claims are resolved.
-   - Use moderate corroboration for BOTH support and contradiction:
-     - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
-     - weak = not sufficiently corroborated; cannot drive recommendation alone.
-   - Treat social low-signal reactions (emoji jokes, one-off comments) as weak warnings unless corroborated.
-
-Save your full report as plain text. This will be passed to a validator agent
-for synthesis.
-""",
-    tools=[search_openalex, get_openalex_work_details],
-    output_key="openalex_raw_report",
-)
-
-# ---------------------------------------------------------------------------
-# Sub-agent 2: Validator / Synthesizer
-# ---------------------------------------------------------------------------
+Classification rules:
+- Use moderate corroboration for BOTH support and contradiction:
+  - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
+  - weak = not sufficiently corroborated; cannot drive recommendation alone.
+- Treat social low-signal reactions (emoji jokes, one-off comments) as weak warnings unless corroborated.
 
-openalex_validator = LlmAgent(
-    name="openalex_validator",
-    model=config.critic_model,
-    description="Validates and synthesizes a raw OpenAlex research report.",
-    instruction="""\
-You are a critical product-validation analyst specializing in academic
-research signals. You will receive a raw research report from OpenAlex
-(in state key `openalex_raw_report`).
+## Assessment
 
-Evaluate the evidence and produce a structured assessment:
+Produce a structured assessment of the evidence:
 
 1. **Key findings** — The most important academic signals.
 2. **Research maturity** — nascent / emerging / established / saturated.
@@ -190,21 +164,42 @@ Recommendation rules:
 - Use `proceed` only when research momentum is active, technology readiness is practical, and there is room to differentiate.
 - Use `pivot` when the science is promising but commercialization path or target use case is weak.
 - Use `abandon` when the field is saturated, impractical, or unlikely to convert into a defensible product.
-""",
-    output_schema=OpenAlexValidation,
-    output_key="openalex_validation",
-)
+"""
 
-# ---------------------------------------------------------------------------
-# Composed agent: Researcher → Validator
-# ---------------------------------------------------------------------------
+# State-dependent guidance goes last so the static preamble above stays an
+# exact, cacheable prompt prefix.
+_RUNTIME_INPUTS = """\
+Read the `research_plan` from session state.
+Use `deep_dive_hypotheses` and `evidence_validation_rules` if present.
+It contains:
+- `product_idea` — the idea to validate
+- `selected_sources` — list of sources to use
+- `search_keywords` — suggested starting keywords
+- `validation_keywords` — keywords for supportive evidence
+- `invalidation_keywords` — keywords for disconfirming evidence
+- `research_focus` — what to focus on
+- `validation_focus` / `invalidation_focus` — focused directions per track
+"""
 
-openalex_agent = SequentialAgent(
+# With tools present, ADK enforces `output_schema` through a final
+# `set_model_response` call (or natively where the model supports both), so
+# the tool loop's last turn is the validation itself.
+openalex_agent = LlmAgent(
     name="openalex_agent",
+    model=config.critic_model,
     description=(
-        "Researches a product idea in academic literature via OpenAlex by "
-        "searching for relevant papers, fetching full details, and validating "
-        "the findings through a critic model."
+        "Researches a product idea in academic literature via OpenAlex and "
+        "assesses the findings as structured validation output."
     ),
-    sub_agents=[openalex_researcher, openalex_validator],
+    instruction=_STATIC_PREAMBLE + "\n## Runtime Inputs\n" + _RUNTIME_INPUTS,
+    tools=[
+        search_openalex_multi,
+        search_openalex,
+        get_openalex_works_batch,
+        get_openalex_work_details,
+    ],
+    output_schema=OpenAlexValidation,
+    output_key="openalex_validation",
+    # Skip the LLM call outright when the plan did not select this source.
+    before_agent_callback=skip_unless_selected("openalex"),
 )
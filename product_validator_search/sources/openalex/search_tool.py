@@ -1,43 +1,191 @@
 """OpenAlex search tools using the OpenAlex REST API.
 
-Provides two ADK-compatible tool functions:
-  - search_openalex: keyword search for academic works (papers, articles)
+Provides four ADK-compatible tool functions:
+  - search_openalex: keyword search for academic works (papers, articles),
+    pre-ranked by citations and recency
+  - search_openalex_multi: run several searches concurrently in one call
   - get_openalex_work_details: fetch full metadata for a specific work
+  - get_openalex_works_batch: fetch full metadata for several works at once
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import math
+import os
+from typing import Any, Awaitable, Callable
 
-import httpx
+import diskcache
+import orjson
+
+from ...config import config
+from ...http_utils import get_client, get_semaphore, retry_transient
 
 _BASE = "https://api.openalex.org"
 _TIMEOUT = 15.0
+# OpenAlex caps OR-filters at 50 values (and per-page at 200).
+_MAX_BATCH_IDS = 50
+_CACHE_SIZE_LIMIT = 2**30
+_USER_AGENT = "product-validator-search/0.1"
+# Only the root fields search results keep; OpenAlex `select` does not
+# accept nested paths, so whole `concepts` objects come back.
+_SEARCH_SELECT = "id,display_name,publication_year,cited_by_count,concepts"
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+# Academic metadata is effectively static on the day scale, so identical
+# calls from retries, refinement rounds, and re-runs are served from disk.
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+@functools.cache
+def _cache() -> diskcache.Cache:
+    """Open the on-disk response cache on first use."""
+    return diskcache.Cache(config.openalex_cache_dir, size_limit=_CACHE_SIZE_LIMIT)
+
+
+def _cached(
+    fn: Callable[..., Awaitable[dict[str, Any]]],
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Cache a tool's result keyed by a hash of its name and bound arguments.
+
+    Arguments are bound to the signature with defaults applied, so ADK's
+    keyword calls and `search_openalex_multi`'s positional calls share
+    entries. Disk reads and writes run in a worker thread to keep SQLite I/O
+    off the event loop while searches fan out concurrently.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = hashlib.sha256(
+            json.dumps({"fn": fn.__name__, "args": bound.arguments}, sort_keys=True).encode()
+        ).hexdigest()
+        cached = await asyncio.to_thread(lambda: _cache().get(key))
+        if cached is not None:
+            _CACHE_STATS["hits"] += 1
+            logger.debug("OpenAlex cache hit for %s (%s)", fn.__name__, _CACHE_STATS)
+            return cached
+
+        result = await fn(*args, **kwargs)
+        await asyncio.to_thread(
+            lambda: _cache().set(key, result, expire=config.openalex_cache_ttl)
+        )
+        _CACHE_STATS["misses"] += 1
+        logger.debug("OpenAlex cache miss for %s (%s)", fn.__name__, _CACHE_STATS)
+        return result
+
+    return wrapper
+
+
+@retry_transient
+async def _get_json(path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    """GET an OpenAlex endpoint under the concurrency cap, retrying transient failures."""
+    params = dict(params or {})
+    headers = {"User-Agent": _USER_AGENT}
+    # Identifying ourselves moves requests into OpenAlex's "polite pool",
+    # which has more reliable latency and higher rate limits.
+    mailto = os.environ.get("OPENALEX_MAILTO")
+    if mailto:
+        params["mailto"] = mailto
+        headers["User-Agent"] = f"{_USER_AGENT} (mailto:{mailto})"
+
+    client = await get_client()
+    async with get_semaphore("openalex"):
+        r = await client.get(
+            f"{_BASE}{path}", params=params, headers=headers, timeout=_TIMEOUT
+        )
+        r.raise_for_status()
+        # Listing payloads run 50-100 KB; orjson decodes them several times
+        # faster than the stdlib parser behind `Response.json()`.
+        return orjson.loads(r.content)
+
+
+# Search results keep only the works a researcher is likely to select.
+_RANK_TOP_K = 5
+_RECENCY_WINDOW_YEARS = 10
+
 
+def rank_openalex_results(
+    works: list[dict[str, Any]],
+    k: int = _RANK_TOP_K,
+    citation_weight: float = 0.6,
+    recency_weight: float = 0.4,
+    current_year: int | None = None,
+) -> list[dict[str, Any]]:
+    """Rank works by log-scaled citations and recency, keeping the top k.
 
-def search_openalex(query: str, num_results: int = 20) -> dict[str, Any]:
+    Args:
+        works: Work dicts as returned in `search_openalex` results.
+        k: Number of works to keep.
+        citation_weight: Weight of `log1p(cited_by_count)`, normalized to the
+            most-cited work in the list.
+        recency_weight: Weight of recency, decaying linearly to 0 over ten
+            years.
+        current_year: The year recency is measured from (default: this year).
+
+    Returns:
+        Up to k works, best first. Ties keep their original (relevance) order.
+    """
+    if current_year is None:
+        current_year = datetime.date.today().year
+    max_citations = max((w.get("cited_by_count") or 0 for w in works), default=0)
+    citation_norm = math.log1p(max_citations) or 1.0
+
+    def score(work: dict[str, Any]) -> float:
+        citations = math.log1p(work.get("cited_by_count") or 0) / citation_norm
+        year = work.get("publication_year")
+        recency = (
+            max(0.0, 1 - (current_year - year) / _RECENCY_WINDOW_YEARS) if year else 0.0
+        )
+        return citation_weight * citations + recency_weight * recency
+
+    return sorted(works, key=score, reverse=True)[:k]
+
+
+@_cached
+async def search_openalex(
+    query: str,
+    num_results: int = 10,
+    auto_rank: bool = True,
+    top_k: int = _RANK_TOP_K,
+) -> dict[str, Any]:
     """Search OpenAlex for academic works matching a query.
 
     Args:
         query: The search query string.
-        num_results: Maximum number of results to return (default 20).
+        num_results: Maximum number of results to fetch (default 10).
+        auto_rank: If True (default), return only the `top_k` works ranked by
+            citations and recency. Set to False to get every result in
+            relevance order.
+        top_k: Number of works kept when `auto_rank` is set (default 5).
 
     Returns:
         A dict with 'query', 'total_count', and 'works' — a list of work dicts
-        containing id, title, publication_year, cited_by_count, doi, and
-        top concepts.
+        containing id, title, publication_year, cited_by_count, and top
+        concepts.
     """
-    r = httpx.get(
-        f"{_BASE}/works",
+    payload = await _get_json(
+        "/works",
         params={
             "search": query,
             "per-page": num_results,
             "sort": "relevance_score:desc",
+            "select": _SEARCH_SELECT,
         },
-        timeout=_TIMEOUT,
     )
-    r.raise_for_status()
-    payload = r.json()
 
     works = []
     for item in payload.get("results", []):
@@ -55,12 +203,13 @@ def search_openalex(query: str, num_results: int = 20) -> dict[str, Any]:
                 "title": title,
                 "publication_year": item.get("publication_year"),
                 "cited_by_count": item.get("cited_by_count", 0),
-                "doi": item.get("doi", ""),
-                "type": item.get("type", ""),
                 "concepts": concepts,
             }
         )
 
+    if auto_rank:
+        works = rank_openalex_results(works, k=top_k)
+
     return {
         "query": query,
         "total_count": payload.get("meta", {}).get("count", 0),
@@ -68,43 +217,90 @@ def search_openalex(query: str, num_results: int = 20) -> dict[str, Any]:
     }
 
 
-def get_openalex_work_details(work_id: str) -> dict[str, Any]:
-    """Fetch detailed metadata for a single OpenAlex work.
+async def search_openalex_multi(
+    queries: list[str],
+    num_results: int = 10,
+    auto_rank: bool = True,
+    top_k: int = _RANK_TOP_K,
+) -> dict[str, Any]:
+    """Run several OpenAlex searches concurrently.
+
+    Use this to issue all queries for a track (validation or invalidation) in
+    a single tool call.
 
     Args:
-        work_id: The OpenAlex work ID — accepts either the full entity URL
-            (e.g. 'https://openalex.org/W2741809807') or just the short ID
-            (e.g. 'W2741809807').
+        queries: The search query strings. Duplicates are dropped.
+        num_results: Maximum number of results to fetch per query (default 10).
+        auto_rank: Passed to `search_openalex` (default True).
+        top_k: Passed to `search_openalex` (default 5).
 
     Returns:
-        A dict with title, abstract, publication_year, cited_by_count,
-        concepts, referenced_works count, related_works count, and
-        authorships.
+        A dict with 'results' — one `search_openalex` result per query that
+        succeeded, in query order — and 'errors' for queries that failed.
     """
+    unique_queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+    responses = await asyncio.gather(
+        *(search_openalex(q, num_results, auto_rank, top_k) for q in unique_queries),
+        return_exceptions=True,
+    )
+
+    results: list[dict[str, Any]] = []
+    errors: list[str] = []
+    for query, response in zip(unique_queries, responses):
+        if isinstance(response, Exception):
+            errors.append(f"{query}: {response}")
+        else:
+            results.append(response)
+    return {"results": results, "errors": errors}
+
+
+def _short_id(work_id: str) -> str:
+    """Strip an OpenAlex entity URL down to its short ID (e.g. 'W2741809807')."""
     # The search results return IDs like "https://openalex.org/W..."
     # but the API endpoint is "https://api.openalex.org/works/W..."
-    short_id = work_id.rsplit("/", 1)[-1] if "/" in work_id else work_id
-    r = httpx.get(
-        f"{_BASE}/works/{short_id}",
-        timeout=_TIMEOUT,
-    )
-    r.raise_for_status()
-    item = r.json()
-
-    # Reconstruct abstract from inverted index if available
-    abstract = ""
-    inv_index = item.get("abstract_inverted_index")
-    if inv_index:
-        word_positions: list[tuple[int, str]] = []
-        for word, positions in inv_index.items():
-            for pos in positions:
-                word_positions.append((pos, word))
-        word_positions.sort()
-        abstract = " ".join(w for _, w in word_positions)
+    return work_id.rsplit("/", 1)[-1] if "/" in work_id else work_id
+
+
+def _reconstruct_abstract(
+    inv_index: dict[str, list[int]] | None, max_chars: int | None = None
+) -> str:
+    """Rebuild abstract text from OpenAlex's word -> positions inverted index.
+
+    Words are written straight into a position-indexed list, so there is no
+    intermediate (position, word) tuple list and no sort. When `max_chars` is
+    given, only the leading words that fit are joined.
+    """
+    if not inv_index:
+        return ""
+    max_pos = max((p for positions in inv_index.values() for p in positions), default=-1)
+    slots = [""] * (max_pos + 1)
+    for word, positions in inv_index.items():
+        for pos in positions:
+            slots[pos] = word
+
+    words = filter(None, slots)
+    if max_chars is None:
+        return " ".join(words)
+
+    kept: list[str] = []
+    size = -1  # no separator before the first word
+    for word in words:
+        if size >= max_chars:
+            break
+        kept.append(word)
+        size += len(word) + 1
+    return " ".join(kept)[:max_chars]
+
+
+def _work_details(
+    item: dict[str, Any], concept_top: int, author_top: int, abstract_chars: int
+) -> dict[str, Any]:
+    """Shape a raw OpenAlex work record into the detail dict returned to agents."""
+    abstract = _reconstruct_abstract(item.get("abstract_inverted_index"), abstract_chars)
 
     concepts = [
         {"name": c.get("display_name", ""), "score": round(c.get("score", 0), 3)}
-        for c in (item.get("concepts") or [])[:10]
+        for c in (item.get("concepts") or [])[:concept_top]
         if c.get("display_name")
     ]
 
@@ -115,13 +311,13 @@ def get_openalex_work_details(work_id: str) -> dict[str, Any]:
             if a.get("institutions")
             else "",
         }
-        for a in (item.get("authorships") or [])[:10]
+        for a in (item.get("authorships") or [])[:author_top]
     ]
 
     return {
         "id": item.get("id", ""),
         "title": item.get("display_name", ""),
-        "abstract": abstract[:2000],
+        "abstract": abstract,
         "publication_year": item.get("publication_year"),
         "cited_by_count": item.get("cited_by_count", 0),
         "type": item.get("type", ""),
@@ -131,3 +327,73 @@ def get_openalex_work_details(work_id: str) -> dict[str, Any]:
         "referenced_works_count": len(item.get("referenced_works", [])),
         "related_works_count": len(item.get("related_works", [])),
     }
+
+
+@_cached
+async def get_openalex_work_details(
+    work_id: str,
+    concept_top: int = 3,
+    author_top: int = 3,
+    abstract_chars: int = 1200,
+) -> dict[str, Any]:
+    """Fetch detailed metadata for a single OpenAlex work.
+
+    Args:
+        work_id: The OpenAlex work ID — accepts either the full entity URL
+            (e.g. 'https://openalex.org/W2741809807') or just the short ID
+            (e.g. 'W2741809807').
+        concept_top: Number of top concepts to include (default 3).
+        author_top: Number of authors to include (default 3).
+        abstract_chars: Maximum abstract length in characters (default 1200).
+
+    Returns:
+        A dict with title, abstract, publication_year, cited_by_count,
+        concepts, referenced_works count, related_works count, and
+        authorships.
+    """
+    item = await _get_json(f"/works/{_short_id(work_id)}")
+    return _work_details(item, concept_top, author_top, abstract_chars)
+
+
+@_cached
+async def get_openalex_works_batch(
+    work_ids: list[str],
+    concept_top: int = 3,
+    author_top: int = 3,
+    abstract_chars: int = 1200,
+) -> dict[str, Any]:
+    """Fetch detailed metadata for several OpenAlex works in one request.
+
+    Args:
+        work_ids: OpenAlex work IDs (full entity URLs or short IDs). At most
+            50 are fetched.
+        concept_top: Number of top concepts to include per work (default 3).
+        author_top: Number of authors to include per work (default 3).
+        abstract_chars: Maximum abstract length in characters (default 1200).
+
+    Returns:
+        A dict with 'works' — one detail dict per work found, each shaped like
+        the result of `get_openalex_work_details` — and 'missing', the
+        requested IDs OpenAlex did not return.
+    """
+    short_ids = list(dict.fromkeys(_short_id(w) for w in work_ids if w))[:_MAX_BATCH_IDS]
+    if not short_ids:
+        return {"works": [], "missing": []}
+
+    payload = await _get_json(
+        "/works",
+        params={
+            "filter": f"openalex_id:{'|'.join(short_ids)}",
+            "per-page": len(short_ids),
+        },
+    )
+
+    works = [
+        _work_details(item, concept_top, author_top, abstract_chars)
+        for item in payload.get("results", [])
+    ]
+    found = {_short_id(w["id"]) for w in works}
+    return {
+        "works": works,
+        "missing": [w for w in short_ids if w not in found],
+    }
@@ -1,3 +1,12 @@
-from .reddit_agent import reddit_agent, RedditValidation
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ...lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from .reddit_agent import reddit_agent, RedditValidation
 
 __all__ = ["reddit_agent", "RedditValidation"]
+
+lazy_exports(__name__, {name: ".reddit_agent" for name in __all__})
@@ -1,21 +1,29 @@
 """Reddit research agent.
 
-A SequentialAgent that researches a product idea on Reddit using public JSON API.
+A single LlmAgent that researches a product idea on Reddit using the public
+JSON API, along both the validation and invalidation tracks, and answers
+directly with a structured `RedditValidation` instead of handing a raw report
+to a separate validator.
 """
 
 from __future__ import annotations
 
 from typing import Literal
 
-from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
+from google.adk.agents import LlmAgent
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...config import config
-from .search_tool import search_reddit, get_reddit_comments
+from ...schema_utils import freeze_json_schema
+from ...source_gate import skip_unless_selected
+from .search_tool import get_reddit_comments, get_reddit_comments_batch, search_reddit
 
 
+@freeze_json_schema
 class RedditValidation(BaseModel):
-    """Structured output produced by the Reddit validator agent."""
+    """Structured output produced by the Reddit agent."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
@@ -35,56 +43,43 @@ class RedditValidation(BaseModel):
     reasoning: str = ""
 
 
-reddit_researcher = LlmAgent(
-    name="reddit_researcher",
-    model=config.worker_model,
-    description="Searches Reddit for discussions relevant to a product idea.",
-    instruction="""\
-You are a Reddit research specialist. Your job is to find unfiltered user
-discussions about a product idea.
-
-## Getting your inputs
-Read the `research_plan` from session state.
-Use `deep_dive_hypotheses` and `evidence_validation_rules` if present.
-It contains:
-- `product_idea` — the idea to validate
-- `selected_sources` — list of sources to use
-- `search_keywords` — suggested starting keywords
-- `validation_keywords` — keywords for supportive evidence
-- `invalidation_keywords` — keywords for disconfirming evidence
-- `validation_focus` / `invalidation_focus` — focused directions per track
-
-**IMPORTANT:** If "reddit" is NOT in `selected_sources`, output
-"Source not selected — skipped." and stop. Do not call any tools.
+_STATIC_PREAMBLE = """\
+You are a Reddit research specialist and a critical product analyst. Find
+unfiltered user discussions about a product idea, then assess them yourself
+and answer with a structured `RedditValidation`.
 
-## Steps (only if selected)
+## Research steps (only if selected — see Runtime Inputs below)
 
 1. **Generate dual-track keywords** — Prefer `validation_keywords` and
    `invalidation_keywords`. If either is missing, fall back to
-   `search_keywords` and derive both supportive and skeptical variants. Use
-   `validation_focus` and `invalidation_focus` when present, otherwise use
-   `research_focus`.
-
-2. **Validation track search** — Call `search_reddit` for at least
-   2 validation queries.
-
-3. **Invalidation track search** — Call `search_reddit` for at least
-   2 invalidation queries using terms like "complaints", "regret buying",
-   "doesn't work", "good enough alternative".
-
-4. **Select top 5** — Pick the 5 most relevant threads (high comment count
-   is better than high score).
-
-5. **Fetch details** — Call `get_reddit_comments` for the selected threads.
-   In refinement rounds, increase `comment_limit` and vary `sort` (for example
-   `top` vs `new`) when needed to verify high-impact claims.
-
-6. **Compose report** — Write a raw report including:
-   - Thread titles and subreddits
-   - Real user quotes (pain points, "I wish X existed")
-   - Competitors mentioned in comments
-   - Overall sentiment (cynical, excited, indifferent)
-   The raw report MUST include:
+   `search_keywords` and derive supportive and skeptical variants.
+   Use `validation_focus` / `invalidation_focus` when present, otherwise
+   use `research_focus`.
+
+2. **Search both tracks at once** — In a single turn, call `search_reddit`
+   for at least 2 validation queries and at least 2 invalidation queries
+   (using terms like "complaints", "regret buying", "doesn't work",
+   "good enough alternative"). Calls issued in the same turn run
+   concurrently, so neither track waits on the other.
+
+3. **Select top threads** — Pick up to 5 threads per track most relevant to
+   it (high comment count is better than high score).
+
+4. **Fetch details** — Call `get_reddit_comments_batch` once with the URLs
+   of all selected threads. Use `get_reddit_comments` only for a single
+   follow-up thread in a refinement round. In refinement rounds, increase
+   `comment_limit` and vary `sort` (for example `top` vs `new`) when needed
+   to verify high-impact claims.
+
+5. **Adaptive refinement loop** — Before answering:
+   - Run up to 2 conditional refinement rounds.
+   - Trigger refinement when evidence is thin, conflicting, or high-impact on either side.
+   - In each round, create up to 4 targeted follow-up queries from observed claims/entities.
+   - Stop early when evidence is strong, convergent, and high-impact claims are resolved.
+
+6. **Organize the evidence** — Note thread titles, subreddits, real user
+   quotes, competitors mentioned in comments, and the overall sentiment
+   (cynical, excited, indifferent). Sort the evidence into:
    - Supporting evidence
    - Disconfirming evidence
    - Contradictions
@@ -96,31 +91,16 @@ It contains:
    - Deep-dive actions taken
    - Evidence gaps
    - Provisional source verdict: `pass`, `warning`, or `fail`
+   These feed the structured fields below; state the provisional verdict
+   and the data quality gaps in `reasoning`.
 
-7. **Adaptive refinement loop** — Before finalizing the report:
-   - Run initial validation/invalidation probes first.
-   - Run up to 2 conditional refinement rounds.
-   - Trigger refinement when evidence is thin, conflicting, or high-impact on either side.
-   - In each round, create up to 4 targeted follow-up queries from observed claims/entities.
-   - Stop early when evidence is strong, convergent, and high-impact claims are resolved.
-   - Use moderate corroboration for BOTH support and contradiction:
-     - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
-     - weak = not sufficiently corroborated; cannot drive recommendation alone.
-   - Treat social low-signal reactions (emoji jokes, one-off comments) as weak warnings unless corroborated.
-
-Save to `reddit_raw_report`.
-""",
-    tools=[search_reddit, get_reddit_comments],
-    output_key="reddit_raw_report",
-)
+Classification rules:
+- Use moderate corroboration for BOTH support and contradiction:
+  - material = at least 2 independent datapoints in-source, OR 1 strong datapoint corroborated by another source.
+  - weak = not sufficiently corroborated; cannot drive recommendation alone.
+- Treat social low-signal reactions (emoji jokes, one-off comments) as weak warnings unless corroborated.
 
-reddit_validator = LlmAgent(
-    name="reddit_validator",
-    model=config.critic_model,
-    description="Validates and synthesizes a raw Reddit research report.",
-    instruction="""\
-You are a critical product analyst evaluating Reddit discussions.
-Read `reddit_raw_report` and produce a structured assessment.
+## Assessment
 
 Focus on:
 - **Brutal honesty**: Reddit users are often harsh. Use this to find real flaws.
@@ -142,13 +122,34 @@ Recommendation rules:
 - Use `abandon` when users are indifferent, hostile, or existing alternatives already satisfy the need.
 
 Output structured `RedditValidation`.
-""",
-    output_schema=RedditValidation,
-    output_key="reddit_validation",
-)
+"""
 
-reddit_agent = SequentialAgent(
+# State-dependent guidance goes last so the static preamble above stays an
+# exact, cacheable prompt prefix.
+_RUNTIME_INPUTS = """\
+Read the `research_plan` from session state.
+Use `deep_dive_hypotheses` and `evidence_validation_rules` if present.
+It contains:
+- `product_idea` — the idea to validate
+- `selected_sources` — list of sources to use
+- `search_keywords` — suggested starting keywords
+- `validation_keywords` — keywords for supportive evidence
+- `invalidation_keywords` — keywords for disconfirming evidence
+- `research_focus` — what to focus on
+- `validation_focus` / `invalidation_focus` — focused directions per track
+"""
+
+# With tools present, ADK enforces `output_schema` through a final
+# `set_model_response` call (or natively where the model supports both), so
+# the tool loop's last turn is the validation itself.
+reddit_agent = LlmAgent(
     name="reddit_agent",
-    description="Researches a product idea on Reddit.",
-    sub_agents=[reddit_researcher, reddit_validator],
+    model=config.critic_model,
+    description="Researches a product idea on Reddit and assesses the discussions.",
+    instruction=_STATIC_PREAMBLE + "\n## Runtime Inputs\n" + _RUNTIME_INPUTS,
+    tools=[search_reddit, get_reddit_comments_batch, get_reddit_comments],
+    output_schema=RedditValidation,
+    output_key="reddit_validation",
+    # Skip the LLM call outright when the plan did not select this source.
+    before_agent_callback=skip_unless_selected("reddit"),
 )
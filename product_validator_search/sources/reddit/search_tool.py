@@ -1,63 +1,127 @@
 """Reddit search tools using the public JSON API.
 
-Provides two ADK-compatible tool functions:
+Provides three ADK-compatible tool functions:
   - search_reddit: keyword search for posts
   - get_reddit_comments: fetch a post's comments
+  - get_reddit_comments_batch: fetch several posts' comments in one call
 """
 
 from __future__ import annotations
 
-from typing import Any
-import httpx
+import asyncio
+import re
 import time
+from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import orjson
+from google.adk.tools.tool_context import ToolContext
+
+from ...http_utils import get_client, get_semaphore
+from ...source_gate import is_source_selected
+from ...ttl_cache import ttl_cache
 
 _REDDIT_BASE = "https://www.reddit.com"
+_SEARCH_URL = f"{_REDDIT_BASE}/search.json"
 _TIMEOUT = 10.0
 _USER_AGENT = "product-validator/0.1"
+# Reddit's public API allows roughly one request per second.
+_MIN_REQUEST_INTERVAL = 1.0
+# Text budgets in UTF-8 bytes, which track prompt size better than code
+# points for non-Latin text.
+_SELFTEXT_MAX_BYTES = 500
+_COMMENT_MAX_BYTES = 1000
+# Repeated searches and thread fetches within a run are served from memory.
+_CACHE_MAXSIZE = 512
+_CACHE_TTL = 900.0
+# Trailing slashes and an existing `.json` suffix, stripped in one pass.
+_JSON_SUFFIX_RE = re.compile(r"(?:\.json)?/*$")
 
 
-def search_reddit(
-    query: str,
-    num_results: int = 10,
-    sort: str = "relevance",
-    time_window: str = "year",
-) -> dict[str, Any]:
-    """Search Reddit posts by keyword.
-
-    Args:
-        query: The search query string.
-        num_results: Maximum number of results to return (default 10).
-        sort: Sorting mode for Reddit search (default "relevance").
-        time_window: Time filter for search (default "year").
+class _RateLimiter:
+    """Space request starts at least `interval` seconds apart.
 
-    Returns:
-        A dict with 'query' and 'posts' — a list of post dicts.
+    Unlike a fixed sleep before every request, an idle limiter lets the next
+    request through immediately, and concurrent callers queue for
+    consecutive slots instead of all sleeping the full interval.
     """
-    headers = {"User-Agent": _USER_AGENT}
-    try:
-        # Respect Reddit's API rules - avoid hitting it too hard
-        time.sleep(1.0)
-
-        r = httpx.get(
-            f"{_REDDIT_BASE}/search.json",
-            params={
-                "q": query,
-                "limit": num_results,
-                "sort": sort,
-                "t": time_window,
-            },
-            headers=headers,
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._last = float("-inf")
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is free."""
+        # A lock that has had waiters is bound to its loop, so each event
+        # loop (e.g. successive `asyncio.run` calls) gets a fresh one.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        async with self._lock:
+            delay = self._last + self._interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last = time.monotonic()
+
+
+_RATE_LIMITER = _RateLimiter(_MIN_REQUEST_INTERVAL)
+
+
+def _clip_utf8(text: str, max_bytes: int) -> str:
+    """Truncate text to at most `max_bytes` UTF-8 bytes without splitting a character."""
+    if len(text) * 4 <= max_bytes:  # cannot exceed the budget; skip encoding
+        return text
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+
+
+async def _get_json(url: str, params: dict[str, Any]) -> Any:
+    """GET a Reddit JSON endpoint through the shared client under the rate limit."""
+    client = await get_client()
+    async with get_semaphore("reddit"):
+        await _RATE_LIMITER.acquire()
+        r = await client.get(
+            url,
+            params=params,
+            headers={"User-Agent": _USER_AGENT},
             timeout=_TIMEOUT,
             follow_redirects=True,
         )
         r.raise_for_status()
-        data = r.json()
-    except Exception as e:
-        return {"query": query, "error": str(e), "posts": []}
+        # Comment threads often run to hundreds of KB; orjson parses the raw
+        # bytes directly and is markedly faster than `Response.json()`.
+        return orjson.loads(r.content)
+
+
+@ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+async def _search_posts(
+    query: str, num_results: int, sort: str, time_window: str
+) -> dict[str, Any]:
+    """Run a Reddit search and shape the posts; HTTP errors propagate.
+
+    `limit` is sent so Reddit returns only the posts we keep instead of its
+    default page of 25; `raw_json=1` disables the legacy HTML entity
+    escaping (`&amp;` etc.) of text fields.
+    """
+    data = await _get_json(
+        _SEARCH_URL,
+        params={
+            "q": query,
+            "limit": num_results,
+            "sort": sort,
+            "t": time_window,
+            "raw_json": 1,
+        },
+    )
 
     posts = []
     # Reddit JSON structure: data -> children -> [ { data: { title, ... } } ]
-    children = data.get("data", {}).get("children", [])
+    try:
+        children = data["data"]["children"]
+    except (KeyError, TypeError):
+        children = ()
 
     for child in children:
         post_data = child.get("data", {})
@@ -68,79 +132,159 @@ def search_reddit(
                 "score": post_data.get("score", 0),
                 "num_comments": post_data.get("num_comments", 0),
                 "subreddit": post_data.get("subreddit", ""),
-                "selftext": (post_data.get("selftext", "") or "")[:500],  # Truncate
+                "selftext": _clip_utf8(post_data.get("selftext", "") or "", _SELFTEXT_MAX_BYTES),
             }
         )
 
     return {"query": query, "posts": posts}
 
 
-def get_reddit_comments(
-    url: str,
-    comment_limit: int = 10,
-    sort: str = "top",
+async def search_reddit(
+    query: str,
+    num_results: int = 10,
+    sort: str = "relevance",
+    time_window: str = "year",
+    tool_context: Optional[ToolContext] = None,
 ) -> dict[str, Any]:
-    """Fetch a Reddit post and its top comments.
+    """Search Reddit posts by keyword.
+
+    Returns immediately with 'skipped' set, without calling Reddit, when the
+    research plan does not select the `reddit` source.
 
     Args:
-        url: The full URL of the Reddit post.
-        comment_limit: Maximum number of root comments to return (default 10).
-        sort: Comment sort order (default "top").
+        query: The search query string.
+        num_results: Maximum number of results to return (default 10).
+        sort: Sorting mode for Reddit search (default "relevance").
+        time_window: Time filter for search (default "year").
 
     Returns:
-        A dict with post details and a list of top comments.
+        A dict with 'query' and 'posts' — a list of post dicts.
     """
-    if not url.endswith(".json"):
-        if url.endswith("/"):
-            url = url[:-1]
-        url = f"{url}.json"
+    if not is_source_selected(tool_context, "reddit"):
+        return {"query": query, "skipped": True, "posts": []}
 
-    headers = {"User-Agent": _USER_AGENT}
     try:
-        time.sleep(1.0)
-
-        r = httpx.get(
-            url,
-            params={"sort": sort},
-            headers=headers,
-            timeout=_TIMEOUT,
-            follow_redirects=True,
-        )
-        r.raise_for_status()
-        data = r.json()
+        return await _search_posts(query, num_results, sort, time_window)
     except Exception as e:
-        return {"url": url, "error": str(e)}
+        return {"query": query, "error": str(e), "posts": []}
+
+
+def _normalize_post_url(url: str) -> str:
+    """Canonicalize a post URL to its `.json` endpoint.
+
+    Trailing slashes, host case, a missing `.json` suffix, and any query
+    string or fragment (e.g. share-link tracking parameters) are normalized
+    so variants of the same thread share one cache entry. Request
+    parameters are sent separately by `_fetch_thread`.
+    """
+    parts = urlsplit(url.strip())
+    path = _JSON_SUFFIX_RE.sub("", parts.path, count=1) + ".json"
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, "", ""))
+
+
+# Shape errors come from a transient bad payload; only cache real threads.
+@ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL, cache_if=lambda thread: "error" not in thread)
+async def _fetch_thread(url: str, comment_limit: int, sort: str) -> dict[str, Any]:
+    """Fetch and shape a thread from its `.json` URL; HTTP errors propagate.
+
+    Only root comments are kept, so `depth=1` and `limit` trim the comment
+    tree server-side; replies are never downloaded.
+    """
+    limit = max(1, comment_limit)
+    data = await _get_json(
+        url,
+        params={"sort": sort, "limit": limit, "depth": 1, "raw_json": 1},
+    )
 
     # Reddit JSON API returns a list: [post_listing, comment_listing]
     if not isinstance(data, list) or len(data) < 2:
         return {"url": url, "error": "Invalid Reddit JSON response"}
 
     # Extract post info from the first listing
-    post_children = data[0].get("data", {}).get("children", [])
+    try:
+        post_children = data[0]["data"]["children"]
+    except (KeyError, TypeError):
+        post_children = ()
     if not post_children:
         return {"url": url, "error": "No post data found"}
 
     post_data = post_children[0].get("data", {})
 
     # Extract comments from the second listing
-    comments_data = data[1].get("data", {}).get("children", [])
+    try:
+        comments_data = data[1]["data"]["children"]
+    except (KeyError, TypeError):
+        comments_data = ()
 
     comments = []
     for child in comments_data:
         c = child.get("data", {})
+        body = c.get("body")
         # Only include actual comments, not "more" objects
-        if c.get("body"):
-            comments.append(
-                {
-                    "author": c.get("author", "[deleted]"),
-                    "body": (c.get("body", "") or "")[:1000],  # Truncate
-                    "score": c.get("score", 0),
-                }
-            )
+        if not body:
+            continue
+        comments.append(
+            {
+                "author": c.get("author", "[deleted]"),
+                "body": _clip_utf8(body, _COMMENT_MAX_BYTES),
+                "score": c.get("score", 0),
+            }
+        )
+        # Stop at the limit rather than shaping every root comment.
+        if len(comments) == limit:
+            break
 
     return {
         "title": post_data.get("title", ""),
         "subreddit": post_data.get("subreddit", ""),
         "score": post_data.get("score", 0),
-        "comments": comments[: max(1, comment_limit)],
+        "comments": comments,
     }
+
+
+async def get_reddit_comments(
+    url: str,
+    comment_limit: int = 10,
+    sort: str = "top",
+) -> dict[str, Any]:
+    """Fetch a Reddit post and its top comments.
+
+    Args:
+        url: The full URL of the Reddit post.
+        comment_limit: Maximum number of root comments to return (default 10).
+        sort: Comment sort order (default "top").
+
+    Returns:
+        A dict with post details and a list of top comments.
+    """
+    url = _normalize_post_url(url)
+    try:
+        return await _fetch_thread(url, comment_limit, sort)
+    except Exception as e:
+        return {"url": url, "error": str(e)}
+
+
+async def get_reddit_comments_batch(
+    urls: list[str],
+    comment_limit: int = 10,
+    sort: str = "top",
+) -> dict[str, Any]:
+    """Fetch several Reddit posts and their top comments concurrently.
+
+    Use this to fetch all selected threads in a single tool call. Requests
+    still respect Reddit's rate limit.
+
+    Args:
+        urls: Full URLs of the Reddit posts. Duplicates are dropped.
+        comment_limit: Maximum number of root comments per post (default 10).
+        sort: Comment sort order (default "top").
+
+    Returns:
+        A dict with 'threads' — one `get_reddit_comments` result per unique
+        URL, in input order.
+    """
+    unique_urls = list(dict.fromkeys(_normalize_post_url(u) for u in urls if u and u.strip()))
+    threads = await asyncio.gather(
+        *(get_reddit_comments(u, comment_limit, sort) for u in unique_urls)
+    )
+    return {"threads": list(threads)}
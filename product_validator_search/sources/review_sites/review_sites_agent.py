@@ -8,15 +8,20 @@ from __future__ import annotations
 from typing import Literal
 
 from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
+from ...source_gate import skip_unless_selected
 from .search_tool import search_review_sites
 
 
+@freeze_json_schema
 class ReviewSitesValidation(BaseModel):
     """Structured output produced by the review-sites validator agent."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
     confidence: Literal["low", "medium", "high"]
@@ -124,4 +129,6 @@ review_sites_agent = SequentialAgent(
     name="review_sites_agent",
     description="Researches buyer-intent signals on public review platforms.",
     sub_agents=[review_sites_researcher, review_sites_validator],
+    # Skip both LLM stages outright when the plan did not select this source.
+    before_agent_callback=skip_unless_selected("review_sites"),
 )
@@ -2,40 +2,62 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from itertools import islice
+from typing import Any, Optional
 
-from ..brave_search.search_tool import search_brave
+from google.adk.tools.tool_context import ToolContext
 
+from ...source_gate import is_source_selected
+from ..brave_search.cache import cached_search_brave as search_brave
 
-def search_review_sites(keywords: list[str], num_results: int = 8) -> dict[str, Any]:
+_QUERY_TEMPLATES = (
+    'site:g2.com "{kw}" reviews pricing',
+    'site:capterra.com "{kw}" reviews alternatives',
+    'site:trustpilot.com "{kw}" review complaints',
+)
+_MAX_KEYWORDS = 5
+_MAX_QUERIES = 9
+
+
+async def search_review_sites(
+    keywords: list[str],
+    num_results: int = 8,
+    tool_context: Optional[ToolContext] = None,
+) -> dict[str, Any]:
     """Search review platforms for buyer-intent signals.
 
     Uses Brave Search with targeted site filters to gather public review evidence
     from G2, Capterra, and Trustpilot without requiring premium APIs.
+
+    Returns immediately with 'skipped' set, without calling Brave, when the
+    research plan does not select the `review_sites` source.
     """
-    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:5]
+    if not is_source_selected(tool_context, "review_sites"):
+        return {"queries": [], "results_by_query": [], "errors": [], "skipped": True}
+
+    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:_MAX_KEYWORDS]
     if not sanitized:
         return {"queries": [], "results_by_query": [], "errors": ["No keywords provided."]}
 
-    queries: list[str] = []
-    for kw in sanitized:
-        queries.extend(
-            [
-                f'site:g2.com "{kw}" reviews pricing',
-                f'site:capterra.com "{kw}" reviews alternatives',
-                f'site:trustpilot.com "{kw}" review complaints',
-            ]
+    deduped_queries = list(
+        islice(
+            dict.fromkeys(t.format(kw=kw) for kw in sanitized for t in _QUERY_TEMPLATES),
+            _MAX_QUERIES,
         )
-
-    deduped_queries = list(dict.fromkeys(queries))[:9]
-    results_by_query: list[dict[str, Any]] = []
-    errors: list[str] = []
-
-    for query in deduped_queries:
-        response = search_brave(query=query, num_results=num_results)
-        if response.get("error"):
-            errors.append(f'{query}: {response["error"]}')
-        results_by_query.append(response)
+    )
+    # Queries are independent; the Brave semaphore caps how many run at once.
+    # gather keeps results in query order.
+    results_by_query: list[dict[str, Any]] = list(
+        await asyncio.gather(
+            *(search_brave(query=query, num_results=num_results) for query in deduped_queries)
+        )
+    )
+    errors = [
+        f'{query}: {response["error"]}'
+        for query, response in zip(deduped_queries, results_by_query)
+        if response.get("error")
+    ]
 
     return {
         "queries": deduped_queries,
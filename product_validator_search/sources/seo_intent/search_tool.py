@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from itertools import islice
+from typing import Any, Optional
 
-from ..brave_search.search_tool import search_brave
+from google.adk.tools.tool_context import ToolContext
 
-_TRANSACTIONAL_MODIFIERS = [
+from ...source_gate import is_source_selected
+from ..brave_search.cache import cached_search_brave as search_brave
+
+_TRANSACTIONAL_MODIFIERS = (
     "pricing",
     "buy",
     "software",
@@ -15,38 +20,58 @@ _TRANSACTIONAL_MODIFIERS = [
     "best",
     "alternative",
     "for teams",
-]
-_INFORMATIONAL_MODIFIERS = [
+)
+_INFORMATIONAL_MODIFIERS = (
     "what is",
     "how to",
     "tutorial",
     "guide",
     "learn",
-]
+)
+# Per keyword: the first four transactional, then three informational variants.
+_QUERY_TEMPLATES = tuple(
+    f'"{{kw}}" {modifier}'
+    for modifier in (*_TRANSACTIONAL_MODIFIERS[:4], *_INFORMATIONAL_MODIFIERS[:3])
+)
+_MAX_KEYWORDS = 5
+_MAX_QUERIES = 14
+
+
+async def search_seo_intent(
+    keywords: list[str],
+    num_results: int = 8,
+    tool_context: Optional[ToolContext] = None,
+) -> dict[str, Any]:
+    """Search informational and transactional variants for keyword intent.
 
+    Returns immediately with 'skipped' set, without calling Brave, when the
+    research plan does not select the `seo_intent` source.
+    """
+    if not is_source_selected(tool_context, "seo_intent"):
+        return {"queries": [], "results_by_query": [], "errors": [], "skipped": True}
 
-def search_seo_intent(keywords: list[str], num_results: int = 8) -> dict[str, Any]:
-    """Search informational and transactional variants for keyword intent."""
-    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:5]
+    sanitized = [kw.strip() for kw in keywords if kw and kw.strip()][:_MAX_KEYWORDS]
     if not sanitized:
         return {"queries": [], "results_by_query": [], "errors": ["No keywords provided."]}
 
-    queries: list[str] = []
-    for kw in sanitized:
-        for modifier in _TRANSACTIONAL_MODIFIERS[:4]:
-            queries.append(f'"{kw}" {modifier}')
-        for modifier in _INFORMATIONAL_MODIFIERS[:3]:
-            queries.append(f'"{kw}" {modifier}')
-
-    deduped_queries = list(dict.fromkeys(queries))[:14]
-    results_by_query: list[dict[str, Any]] = []
-    errors: list[str] = []
-
-    for query in deduped_queries:
-        response = search_brave(query=query, num_results=num_results)
-        if response.get("error"):
-            errors.append(f'{query}: {response["error"]}')
-        results_by_query.append(response)
+    deduped_queries = list(
+        islice(
+            dict.fromkeys(t.format(kw=kw) for kw in sanitized for t in _QUERY_TEMPLATES),
+            _MAX_QUERIES,
+        )
+    )
+    # Queries are independent; the Brave semaphore caps how many run at once.
+    # gather keeps results in query order.
+    results_by_query: list[dict[str, Any]] = list(
+        await asyncio.gather(
+            *(search_brave(query=query, num_results=num_results) for query in deduped_queries)
+        )
+    )
+    errors = [
+        f'{query}: {response["error"]}'
+        for query, response in zip(deduped_queries, results_by_query)
+        if response.get("error")
+    ]
 
     return {
         "queries": deduped_queries,
@@ -8,15 +8,20 @@ from __future__ import annotations
 from typing import Literal
 
 from google.adk.agents import LlmAgent, SequentialAgent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...config import config
+from ...schema_utils import freeze_json_schema
+from ...source_gate import skip_unless_selected
 from .search_tool import search_seo_intent
 
 
+@freeze_json_schema
 class SeoIntentValidation(BaseModel):
     """Structured output produced by the SEO-intent validator agent."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     recommendation: Literal["proceed", "pivot", "abandon"]
     signal_score: int = Field(ge=0, le=100)
     confidence: Literal["low", "medium", "high"]
@@ -122,4 +127,6 @@ seo_intent_agent = SequentialAgent(
     name="seo_intent_agent",
     description="Researches transactional search intent for the product category.",
     sub_agents=[seo_intent_researcher, seo_intent_validator],
+    # Skip both LLM stages outright when the plan did not select this source.
+    before_agent_callback=skip_unless_selected("seo_intent"),
 )
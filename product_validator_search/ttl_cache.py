@@ -0,0 +1,87 @@
+"""In-process TTL cache for async source tools.
+
+Researchers repeat overlapping queries across tracks and refinement rounds.
+``ttl_cache`` memoizes an async tool's result by its bound arguments for a
+short window, so repeats return without any HTTP traffic. Concurrent calls
+with the same arguments share one in-flight request (single-flight).
+Exceptions are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import inspect
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert list/dict arguments into an equivalent hashable key part."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def ttl_cache(
+    maxsize: int = 512,
+    ttl: float = 900.0,
+    cache_if: Callable[[Any], bool] | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Memoize an async function's results for `ttl` seconds (LRU-bounded).
+
+    Callers receive deep copies, so mutating a result cannot corrupt the
+    cache. The wrapper exposes ``cache_clear()``.
+
+    Args:
+        maxsize: Maximum number of cached results; least recently used
+            entries are evicted first.
+        ttl: Seconds a result stays valid.
+        cache_if: Optional predicate; results it rejects (e.g. error dicts
+            from tools that do not raise) are returned but not stored.
+
+    Returns:
+        A decorator for async functions.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(fn)
+        entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        inflight: dict[Hashable, asyncio.Future[T]] = {}
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _freeze(bound.arguments)
+
+            entry = entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                inflight[key] = task
+                task.add_done_callback(lambda _task: inflight.pop(key, None))
+            # Shield so one cancelled waiter does not cancel the shared call.
+            result = await asyncio.shield(task)
+
+            if cache_if is None or cache_if(result):
+                entries[key] = (time.monotonic() + ttl, result)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return copy.deepcopy(result)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+"""Shared pytest fixtures."""
+
+import importlib
+
+import pytest
+from google.adk.agents import LlmAgent
+
+# Every source package follows the `sources/<name>/<name>_agent.py` layout.
+SOURCE_NAMES = (
+    "brave_search",
+    "competitors",
+    "github",
+    "google_trends",
+    "hackernews",
+    "jobs_signal",
+    "openalex",
+    "reddit",
+    "review_sites",
+    "seo_intent",
+)
+# Hacker News and jobs signal are validated together by multi_source_validator.
+_BATCH_VALIDATED = frozenset({"hackernews", "jobs_signal"})
+# OpenAlex and Reddit research and validate in one structured-output agent.
+_SELF_VALIDATED = frozenset({"openalex", "reddit"})
+_VALIDATORS = tuple(
+    (f"{name}.{name}_agent", f"{name}_agent" if name in _SELF_VALIDATED else f"{name}_validator")
+    for name in SOURCE_NAMES
+    if name not in _BATCH_VALIDATED
+) + (("multi_source_validator", "multi_source_validator"),)
+
+
+def _load(module, name):
+    """Import ``product_validator_search.sources.<module>`` and return ``name``."""
+    return getattr(importlib.import_module(f"product_validator_search.sources.{module}"), name)
+
+
+def _prompt(agent):
+    """Return an agent's instruction, joining its LLM sub-agents' for composites."""
+    if isinstance(agent, LlmAgent):
+        return agent.instruction
+    return "\n".join(_prompt(sub_agent) for sub_agent in agent.sub_agents)
+
+
+def _missing(text, required):
+    """Return the required literals absent from `text`, so a failure lists them all."""
+    return sorted(literal for literal in required if literal not in text)
+
+
+# ---------------------------------------------------------------------------
+# Source agents (one case per source, imported on first use)
+# ---------------------------------------------------------------------------
+
+
+# Each case imports only its own source module, so `pytest -k seo_intent`
+# loads one source and a failing source does not hide the others.
+@pytest.fixture(scope="session", params=SOURCE_NAMES)
+def researcher(request):
+    name = request.param
+    role = "agent" if name in _SELF_VALIDATED else "researcher"
+    return _load(f"{name}.{name}_agent", f"{name}_{role}")
+
+
+@pytest.fixture(scope="session")
+def prompt_view(researcher):
+    """The researcher's prompt and its lowercased copy, built once per source."""
+    prompt = _prompt(researcher)
+    return prompt, prompt.lower()
+
+
+@pytest.fixture(scope="session", params=_VALIDATORS, ids=[name for _, name in _VALIDATORS])
+def validator(request):
+    return _load(*request.param)
+
+
+@pytest.fixture(scope="session")
+def missing_literals():
+    """The prompt-contract checker: ``missing_literals(text, required)``."""
+    return _missing
+
+
+# ---------------------------------------------------------------------------
+# Validation model instances (validated once per session)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def review_validation():
+    from product_validator_search.sources.review_sites.review_sites_agent import (
+        ReviewSitesValidation,
+    )
+
+    return ReviewSitesValidation(
+        recommendation="pivot",
+        signal_score=58,
+        confidence="medium",
+        evidence_strength=60,
+        evidence_quality="moderate",
+        review_volume_signal="Moderate volume in last 12 months",
+        avg_rating_signal="3.9/5 weighted estimate",
+        top_switching_reasons=["Poor onboarding", "Weak integrations"],
+        price_sensitivity_mentions=["Too expensive for SMB", "Pricing is unclear"],
+        reasoning="Clear pain exists, but wedge is not yet differentiated.",
+    )
+
+
+@pytest.fixture(scope="session")
+def jobs_validation():
+    from product_validator_search.sources.jobs_signal.jobs_signal_agent import (
+        JobsSignalValidation,
+    )
+
+    return JobsSignalValidation(
+        recommendation="proceed",
+        signal_score=74,
+        confidence="medium",
+        evidence_strength=71,
+        evidence_quality="strong",
+        hiring_velocity_signal="Consistent openings across enterprise firms",
+        roles_related_to_problem=["RevOps Analyst", "Sales Enablement Manager"],
+        enterprise_adoption_clues=["Implementation roles mention budget ownership"],
+        reasoning="Budget urgency appears sustained across multiple industries.",
+    )
+
+
+@pytest.fixture(scope="session")
+def seo_validation():
+    from product_validator_search.sources.seo_intent.seo_intent_agent import (
+        SeoIntentValidation,
+    )
+
+    return SeoIntentValidation(
+        recommendation="abandon",
+        signal_score=32,
+        confidence="low",
+        evidence_strength=35,
+        evidence_quality="weak",
+        transactional_keyword_share="Low (~15%)",
+        estimated_cpc_band="low",
+        category_competitiveness="high",
+        reasoning="Commercial intent is weak in this category.",
+    )
@@ -1,17 +1,26 @@
 """Smoke test to verify imports and agent construction."""
 
 import pytest
-from product_validator_search.agent import (
-    root_agent,
-    market_research,
-    buyer_intent_research,
-    community_tech_research,
-)
 from product_validator_search.resilient_parallel_agent import ResilientParallelAgent
 
+_MARKET = frozenset({"brave_search_agent", "google_trends_agent", "competitors_agent"})
+_BUYER_INTENT = frozenset({"review_sites_agent", "jobs_signal_agent", "seo_intent_agent"})
+_COMMUNITY_TECH = frozenset({"hackernews_agent", "reddit_agent", "github_agent", "openalex_agent"})
+
 
+# Tests marked `slow` build the full root agent graph; `pytest -m "not slow"`
+# skips them, and the agent module is imported inside each so that
+# deselecting them skips the construction too.
+@pytest.mark.slow
 def test_imports():
     """Verify that the main agent and batched sub-agents can be imported."""
+    from product_validator_search.agent import (
+        buyer_intent_research,
+        community_tech_research,
+        market_research,
+        root_agent,
+    )
+
     assert root_agent is not None
     assert market_research is not None
     assert buyer_intent_research is not None
@@ -23,30 +32,147 @@ def test_imports():
     # Check Batch 1: Market Research (3 agents)
     # Brave Search, Google Trends, Competitors
     assert len(market_research.sub_agents) == 3
-    market_names = {agent.name for agent in market_research.sub_agents}
-    assert market_names == {
-        "brave_search_agent",
-        "google_trends_agent",
-        "competitors_agent",
-    }
+    assert {agent.name for agent in market_research.sub_agents} == _MARKET
 
     # Check Batch 2: Buyer Intent (3 agents)
     # Review sites, jobs, SEO intent
     assert len(buyer_intent_research.sub_agents) == 3
-    buyer_names = {agent.name for agent in buyer_intent_research.sub_agents}
-    assert buyer_names == {
-        "review_sites_agent",
-        "jobs_signal_agent",
-        "seo_intent_agent",
-    }
+    assert {agent.name for agent in buyer_intent_research.sub_agents} == _BUYER_INTENT
 
     # Check Batch 3: Community & Tech (4 agents)
     # HackerNews, Reddit, GitHub, OpenAlex
     assert len(community_tech_research.sub_agents) == 4
-    tech_names = {agent.name for agent in community_tech_research.sub_agents}
-    assert tech_names == {
-        "hackernews_agent",
-        "reddit_agent",
-        "github_agent",
-        "openalex_agent",
-    }
+    assert {agent.name for agent in community_tech_research.sub_agents} == _COMMUNITY_TECH
+
+
+@pytest.mark.slow
+def test_source_batches_run_concurrently():
+    """All three batches share one parallel stage ahead of the final validator."""
+    from product_validator_search.agent import all_sources_research, execution_pipeline
+
+    assert isinstance(all_sources_research, ResilientParallelAgent)
+    assert [agent.name for agent in all_sources_research.sub_agents] == [
+        "market_research",
+        "buyer_intent_research",
+        "community_tech_research",
+    ]
+    assert [agent.name for agent in execution_pipeline.sub_agents] == [
+        "all_sources_research",
+        "multi_source_validator",
+        "final_validator",
+    ]
+
+
+@pytest.mark.slow
+def test_conftest_source_names_match_agent():
+    """The fixtures' source list stays in step with the planner's vocabulary."""
+    from conftest import SOURCE_NAMES
+    from product_validator_search.agent import SOURCE_NAMES as AGENT_SOURCE_NAMES
+
+    assert sorted(SOURCE_NAMES) == sorted(AGENT_SOURCE_NAMES)
+
+
+@pytest.mark.slow
+def test_app_enables_context_caching_for_static_instructions():
+    """The ADK App wraps the root agent with provider-side context caching."""
+    from product_validator_search.agent import app, root_agent
+
+    assert app.root_agent is root_agent
+    assert app.context_cache_config is not None
+    assert app.context_cache_config.ttl_seconds > 0
+
+
+def test_openalex_exports_single_canonical_schema():
+    """The package-level OpenAlex exports resolve to the one module definition."""
+    import importlib
+
+    from product_validator_search import sources
+
+    module = importlib.import_module("product_validator_search.sources.openalex.openalex_agent")
+
+    assert sources.OpenAlexValidation is module.OpenAlexValidation
+    assert sources.openalex_agent is module.openalex_agent
+    assert "evidence_strength" in module.OpenAlexValidation.model_fields
+    assert "material_supporting_evidence" in module.OpenAlexValidation.model_fields
+
+
+@pytest.mark.parametrize(
+    "source, schema_name",
+    [("openalex", "OpenAlexValidation"), ("reddit", "RedditValidation")],
+)
+def test_dual_track_sources_research_and_validate_in_one_agent(source, schema_name):
+    """The researcher emits the structured validation itself; no validator hop."""
+    import importlib
+
+    from google.adk.agents import LlmAgent
+
+    module = importlib.import_module(f"product_validator_search.sources.{source}.{source}_agent")
+    agent = getattr(module, f"{source}_agent")
+
+    assert isinstance(agent, LlmAgent)
+    assert agent.tools
+    assert agent.output_schema is getattr(module, schema_name)
+    assert agent.output_key == f"{source}_validation"
+    assert not hasattr(module, f"{source}_validator")
+
+
+@pytest.mark.parametrize(
+    "module_name, model_name",
+    [
+        ("openalex.openalex_agent", "OpenAlexValidation"),
+        ("reddit.reddit_agent", "RedditValidation"),
+        ("review_sites.review_sites_agent", "ReviewSitesValidation"),
+        ("seo_intent.seo_intent_agent", "SeoIntentValidation"),
+        ("brave_search.brave_search_agent", "BraveSearchValidation"),
+        ("competitors.competitors_agent", "CompetitorValidation"),
+        ("github.github_agent", "GitHubValidation"),
+        ("google_trends.google_trends_agent", "GoogleTrendsValidation"),
+    ],
+)
+def test_validation_json_schema_is_precomputed(module_name, model_name):
+    """Callers that rewrite the schema in place cannot corrupt later requests."""
+    import importlib
+
+    module = importlib.import_module(f"product_validator_search.sources.{module_name}")
+    model = getattr(module, model_name)
+
+    schema = model.model_json_schema()
+    schema["properties"].clear()
+
+    assert "recommendation" in model.model_json_schema()["properties"]
+    assert model.model_json_schema(mode="serialization")["title"] == model_name
+
+
+def test_tool_module_import_does_not_build_agents():
+    """Source exports are lazy, so tool-only imports skip agent construction."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import product_validator_search.sources.openalex.search_tool\n"
+        "import product_validator_search.sources.reddit.search_tool\n"
+        "assert not any(m.endswith('_agent') for m in sys.modules\n"
+        "               if m.startswith('product_validator_search.sources.')), sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("source", ["openalex", "reddit", "review_sites", "seo_intent"])
+def test_unselected_source_agents_are_skipped_before_any_llm_call(source):
+    """The source agent's gate short-circuits when the plan omits it."""
+    import importlib
+    from types import SimpleNamespace
+
+    from product_validator_search.source_gate import SKIPPED_REPORT
+
+    module = importlib.import_module(f"product_validator_search.sources.{source}.{source}_agent")
+    gate = getattr(module, f"{source}_agent").before_agent_callback
+
+    selected = SimpleNamespace(state={"research_plan": {"selected_sources": [source]}})
+    assert gate(selected) is None
+
+    skipped = SimpleNamespace(state={"research_plan": {"selected_sources": ["github"]}})
+    reply = gate(skipped)
+    assert reply.parts[0].text == SKIPPED_REPORT
+    assert skipped.state[f"{source}_raw_report"] == SKIPPED_REPORT
@@ -1,40 +1,110 @@
 """Tests for optional depth/sorting parameters in search tools."""
 
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import diskcache
+import httpx
+import orjson
+import pytest
+from tenacity import stop_after_attempt, wait_none
+
+from product_validator_search import http_utils
+from product_validator_search.sources.brave_search import cache as brave_cache
+from product_validator_search.sources.brave_search import search_tool as brave_tool
 from product_validator_search.sources.hackernews import search_tool as hn_tool
+from product_validator_search.sources.jobs_signal import search_tool as jobs_tool
+from product_validator_search.sources.openalex import search_tool as openalex_tool
 from product_validator_search.sources.reddit import search_tool as reddit_tool
+from product_validator_search.sources.seo_intent import search_tool as seo_tool
 
 
 class _FakeResponse:
     def __init__(self, payload):
         self._payload = payload
 
+    @property
+    def content(self):
+        return orjson.dumps(self._payload)
+
     def raise_for_status(self):
         return None
 
+    async def aiter_bytes(self, chunk_size=16):
+        body = self.content
+        for i in range(0, len(body), chunk_size):
+            yield body[i : i + chunk_size]
+
     def json(self):
         return self._payload
 
 
-def test_search_reddit_supports_custom_sort_and_time_window(monkeypatch):
+async def _no_sleep(_delay):
+    return None
+
+
+@pytest.fixture
+def openalex_cache(monkeypatch, tmp_path):
+    cache = diskcache.Cache(str(tmp_path / "openalex"))
+    monkeypatch.setattr(openalex_tool, "_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    """Return an installer that points a tool module at a fake shared client."""
+
+    def install(module, **methods):
+        client = SimpleNamespace(**methods)
+
+        async def fake_get_client():
+            return client
+
+        monkeypatch.setattr(module, "get_client", fake_get_client)
+
+    return install
+
+
+@pytest.fixture
+def fake_reddit(monkeypatch, fake_http):
+    """Give a Reddit test empty caches, no rate-limit sleeps, and a client installer."""
+    reddit_tool._search_posts.cache_clear()
+    reddit_tool._fetch_thread.cache_clear()
+    monkeypatch.setattr(reddit_tool.asyncio, "sleep", _no_sleep)
+    yield functools.partial(fake_http, reddit_tool)
+    reddit_tool._search_posts.cache_clear()
+    reddit_tool._fetch_thread.cache_clear()
+
+
+class _FakeToolContext:
+    def __init__(self, invocation_id="inv-1"):
+        self.invocation_id = invocation_id
+        self.state = {}
+
+
+async def test_search_reddit_supports_custom_sort_and_time_window(fake_reddit):
     captured = {}
 
-    def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
+    async def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
         captured["url"] = url
         captured["params"] = params
         return _FakeResponse({"data": {"children": []}})
 
-    monkeypatch.setattr(reddit_tool.time, "sleep", lambda _x: None)
-    monkeypatch.setattr(reddit_tool.httpx, "get", fake_get)
+    fake_reddit(get=fake_get)
 
-    reddit_tool.search_reddit("idea query", num_results=7, sort="new", time_window="month")
+    await reddit_tool.search_reddit("idea query", num_results=7, sort="new", time_window="month")
 
     assert captured["url"].endswith("/search.json")
     assert captured["params"]["limit"] == 7
     assert captured["params"]["sort"] == "new"
     assert captured["params"]["t"] == "month"
+    assert captured["params"]["raw_json"] == 1
 
 
-def test_get_reddit_comments_honors_comment_limit_and_sort(monkeypatch):
+async def test_get_reddit_comments_honors_comment_limit_and_sort(fake_reddit):
     captured = {}
     payload = [
         {"data": {"children": [{"data": {"title": "Post", "subreddit": "test", "score": 5}}]}},
@@ -49,15 +119,14 @@ def test_get_reddit_comments_honors_comment_limit_and_sort(monkeypatch):
         },
     ]
 
-    def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
+    async def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
         captured["url"] = url
         captured["params"] = params
         return _FakeResponse(payload)
 
-    monkeypatch.setattr(reddit_tool.time, "sleep", lambda _x: None)
-    monkeypatch.setattr(reddit_tool.httpx, "get", fake_get)
+    fake_reddit(get=fake_get)
 
-    result = reddit_tool.get_reddit_comments(
+    result = await reddit_tool.get_reddit_comments(
         "https://www.reddit.com/r/test/comments/abc/sample_post/",
         comment_limit=2,
         sort="new",
@@ -65,10 +134,141 @@ def test_get_reddit_comments_honors_comment_limit_and_sort(monkeypatch):
 
     assert captured["url"].endswith(".json")
     assert captured["params"]["sort"] == "new"
+    assert captured["params"]["limit"] == 2
+    assert captured["params"]["depth"] == 1
     assert len(result["comments"]) == 2
 
 
-def test_get_hackernews_comments_honors_max_depth_and_comment_limit(monkeypatch):
+async def test_get_reddit_comments_serves_url_variants_from_cache(fake_reddit):
+    calls = []
+    payload = [
+        {"data": {"children": [{"data": {"title": "Post"}}]}},
+        {"data": {"children": [{"data": {"author": "a1", "body": "c1"}}]}},
+    ]
+
+    async def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
+        calls.append(url)
+        return _FakeResponse(payload)
+
+    fake_reddit(get=fake_get)
+
+    first = await reddit_tool.get_reddit_comments("https://WWW.reddit.com/r/t/comments/abc/x/")
+    first["comments"].clear()
+    second = await reddit_tool.get_reddit_comments("https://www.reddit.com/r/t/comments/abc/x.json")
+    await reddit_tool.get_reddit_comments(
+        "https://www.reddit.com/r/t/comments/abc/x/?utm_source=share#top"
+    )
+
+    assert calls == ["https://www.reddit.com/r/t/comments/abc/x.json"]
+    assert second["comments"] == [{"author": "a1", "body": "c1", "score": 0}]
+
+
+async def test_get_reddit_comments_does_not_cache_bad_payloads(fake_reddit):
+    payloads = [
+        {"unexpected": "shape"},
+        [
+            {"data": {"children": [{"data": {"title": "Post"}}]}},
+            {"data": {"children": []}},
+        ],
+    ]
+
+    async def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
+        return _FakeResponse(payloads.pop(0))
+
+    fake_reddit(get=fake_get)
+    url = "https://www.reddit.com/r/t/comments/abc/x/"
+
+    first = await reddit_tool.get_reddit_comments(url)
+    second = await reddit_tool.get_reddit_comments(url)
+
+    assert first["error"] == "Invalid Reddit JSON response"
+    assert payloads == []
+    assert "error" not in second
+
+
+async def test_get_reddit_comments_batch_fetches_unique_threads_in_order(fake_reddit):
+    async def fake_get(url, params=None, headers=None, timeout=None, follow_redirects=None):
+        title = url.rsplit("/", 1)[-1].removesuffix(".json")
+        return _FakeResponse(
+            [
+                {"data": {"children": [{"data": {"title": title}}]}},
+                {"data": {"children": []}},
+            ]
+        )
+
+    fake_reddit(get=fake_get)
+
+    result = await reddit_tool.get_reddit_comments_batch(
+        [
+            "https://www.reddit.com/r/t/comments/1/b/",
+            "https://www.reddit.com/r/t/comments/2/a",
+            "https://www.reddit.com/r/t/comments/1/b.json",
+        ]
+    )
+
+    assert [t["title"] for t in result["threads"]] == ["b", "a"]
+
+
+def test_host_semaphores_survive_successive_event_loops():
+    async def contend():
+        async def hold():
+            async with http_utils.get_semaphore("reddit"):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(hold() for _ in range(8)))
+
+    # A semaphore that had waiters is bound to its loop; a fresh loop (as in
+    # repeated asyncio.run calls from scripts) must get its own.
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+
+def test_clip_utf8_caps_bytes_without_splitting_characters():
+    assert reddit_tool._clip_utf8("ascii text", 5) == "ascii"
+    clipped = reddit_tool._clip_utf8("日本語のテキスト", 7)
+    assert clipped == "日本"
+    assert len(clipped.encode("utf-8")) <= 7
+
+
+async def test_reddit_rate_limiter_spaces_requests_without_idle_sleep(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock["now"] += delay
+
+    monkeypatch.setattr(reddit_tool.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(reddit_tool.asyncio, "sleep", fake_sleep)
+    limiter = reddit_tool._RateLimiter(1.0)
+
+    await limiter.acquire()
+    clock["now"] += 0.25
+    await limiter.acquire()
+    clock["now"] += 5.0
+    await limiter.acquire()
+
+    assert sleeps == [0.75]
+
+
+def test_reddit_rate_limiter_survives_successive_event_loops(monkeypatch):
+    real_sleep = asyncio.sleep
+
+    async def yield_once(_delay):
+        # Yield while holding the lock so the other acquirers queue on it.
+        await real_sleep(0)
+
+    monkeypatch.setattr(reddit_tool.asyncio, "sleep", yield_once)
+    limiter = reddit_tool._RateLimiter(1.0)
+
+    async def contend():
+        await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+
+async def test_get_hackernews_comments_honors_max_depth_and_comment_limit(fake_http):
     payload = {
         "title": "HN post",
         "url": "https://example.com",
@@ -92,12 +292,443 @@ def test_get_hackernews_comments_honors_max_depth_and_comment_limit(monkeypatch)
         ],
     }
 
-    def fake_get(url, timeout=None):
-        return _FakeResponse(payload)
+    @asynccontextmanager
+    async def fake_stream(method, url, timeout=None):
+        yield _FakeResponse(payload)
 
-    monkeypatch.setattr(hn_tool.httpx, "get", fake_get)
+    fake_http(hn_tool, stream=fake_stream)
 
-    result = hn_tool.get_hackernews_comments("123", max_depth=1, comment_limit=2)
+    result = await hn_tool.get_hackernews_comments("123", max_depth=1, comment_limit=2)
 
     assert len(result["comments"]) == 2
-    assert all(c["depth"] <= 1 for c in result["comments"])
+    assert all(c.depth <= 1 for c in result["comments"])
+    assert result["title"] == "HN post"
+    assert result["points"] == 10
+
+
+def test_flatten_hackernews_comments_stops_at_byte_budget():
+    thread = [
+        {"type": "comment", "author": f"u{i}", "text": "x" * 100, "children": []}
+        for i in range(10)
+    ]
+    budget = hn_tool._FlattenBudget(max_bytes=250, max_scanned=1000)
+
+    comments = hn_tool._flatten_comments(thread, max_depth=3, budget=budget)
+
+    assert [c.author for c in comments] == ["u0", "u1", "u2"]
+    assert budget.exhausted
+
+
+def test_flatten_hackernews_comments_counts_utf8_bytes():
+    thread = [
+        {"type": "comment", "author": f"u{i}", "text": "é" * 50, "children": []}
+        for i in range(3)
+    ]
+    budget = hn_tool._FlattenBudget(max_bytes=150, max_scanned=1000)
+
+    comments = hn_tool._flatten_comments(thread, max_depth=3, budget=budget)
+
+    assert [c.author for c in comments] == ["u0", "u1"]
+    assert budget.bytes_used == 200
+
+
+async def test_get_hackernews_comments_retry_starts_with_fresh_budget(monkeypatch, fake_http):
+    payload = {
+        "title": "HN post",
+        "children": [
+            {"type": "comment", "author": f"u{i}", "text": "x" * 100, "children": []}
+            for i in range(3)
+        ],
+    }
+    attempts = []
+
+    class _FailingResponse(_FakeResponse):
+        async def aiter_bytes(self, chunk_size=16):
+            body = self.content
+            yield body[: len(body) - 10]
+            raise httpx.ReadError("connection reset")
+
+    @asynccontextmanager
+    async def fake_stream(method, url, timeout=None):
+        attempts.append(url)
+        yield (_FailingResponse if len(attempts) == 1 else _FakeResponse)(payload)
+
+    fake_http(hn_tool, stream=fake_stream)
+    monkeypatch.setattr(hn_tool._fetch_item.retry, "wait", wait_none())
+
+    result = await hn_tool.get_hackernews_comments("123", max_bytes=350)
+
+    assert len(attempts) == 2
+    assert [c.author for c in result["comments"]] == ["u0", "u1", "u2"]
+    assert result["truncated"] is False
+
+
+async def test_search_hackernews_requests_minimal_attributes_and_skips_untitled(fake_http):
+    captured = {}
+    payload = {
+        "nbHits": 3,
+        "hits": [
+            {"objectID": "1", "title": "Show HN: Thing", "points": 12, "num_comments": 4},
+            {"objectID": "2", "title": "", "story_title": ""},
+            {"objectID": "3", "story_title": "Parent story", "url": "https://example.com"},
+        ],
+    }
+
+    async def fake_get(url, params=None, timeout=None):
+        captured["params"] = params
+        return _FakeResponse(payload)
+
+    fake_http(hn_tool, get=fake_get)
+
+    result = await hn_tool.search_hackernews("idea", num_results=5)
+
+    assert "story_title" in captured["params"]["attributesToRetrieve"]
+    assert captured["params"]["attributesToHighlight"] == ""
+    assert [hit["objectID"] for hit in result["hits"]] == ["1", "3"]
+    assert result["hits"][0]["url"] == "https://news.ycombinator.com/item?id=1"
+    assert result["hits"][1]["title"] == "Parent story"
+
+
+async def test_search_hackernews_skips_queries_already_run_this_invocation(fake_http):
+    calls = []
+
+    async def fake_get(url, params=None, timeout=None):
+        calls.append(params["query"])
+        return _FakeResponse({"nbHits": 0, "hits": []})
+
+    fake_http(hn_tool, get=fake_get)
+    ctx = _FakeToolContext()
+
+    await hn_tool.search_hackernews("CRM for  Plumbers", tool_context=ctx)
+    repeat = await hn_tool.search_hackernews("crm for plumbers ", tool_context=ctx)
+
+    assert calls == ["CRM for  Plumbers"]
+    assert repeat["duplicate"] is True
+
+    ctx.invocation_id = "inv-2"
+    await hn_tool.search_hackernews("crm for plumbers", tool_context=ctx)
+    assert len(calls) == 2
+
+
+async def test_search_hackernews_failed_query_is_not_marked_duplicate(monkeypatch, fake_http):
+    outcomes = [httpx.ConnectError("algolia down"), {"nbHits": 1, "hits": []}]
+
+    async def fake_get(url, params=None, timeout=None):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _FakeResponse(outcome)
+
+    fake_http(hn_tool, get=fake_get)
+    monkeypatch.setattr(hn_tool._fetch_search.retry, "stop", stop_after_attempt(1))
+    ctx = _FakeToolContext()
+
+    with pytest.raises(httpx.ConnectError):
+        await hn_tool.search_hackernews("foo", tool_context=ctx)
+    retry = await hn_tool.search_hackernews("foo", tool_context=ctx)
+
+    assert "duplicate" not in retry
+    assert retry["total_hits"] == 1
+
+
+async def test_search_hackernews_larger_num_results_is_not_a_duplicate(fake_http):
+    sizes = []
+
+    async def fake_get(url, params=None, timeout=None):
+        sizes.append(params["hitsPerPage"])
+        return _FakeResponse({"nbHits": 0, "hits": []})
+
+    fake_http(hn_tool, get=fake_get)
+    ctx = _FakeToolContext()
+
+    await hn_tool.search_hackernews("foo", num_results=5, tool_context=ctx)
+    await hn_tool.search_hackernews("foo", num_results=30, tool_context=ctx)
+    repeat = await hn_tool.search_hackernews("foo", num_results=30, tool_context=ctx)
+
+    assert sizes == [5, 30]
+    assert repeat["duplicate"] is True
+
+
+async def test_search_hackernews_retries_transient_status(monkeypatch, fake_http):
+    statuses = [503, 200]
+
+    async def fake_get(url, params=None, timeout=None):
+        request = httpx.Request("GET", url)
+        body = orjson.dumps({"nbHits": 0, "hits": []})
+        return httpx.Response(statuses.pop(0), content=body, request=request)
+
+    fake_http(hn_tool, get=fake_get)
+    monkeypatch.setattr(hn_tool._fetch_search.retry, "wait", wait_none())
+
+    result = await hn_tool.search_hackernews("idea")
+
+    assert statuses == []
+    assert result["hits"] == []
+
+
+async def test_search_jobs_signal_dedupes_case_insensitively(monkeypatch):
+    sent = []
+
+    async def fake_search_brave(query, num_results=10):
+        sent.append(query)
+        return {"query": query, "results": []}
+
+    monkeypatch.setattr(jobs_tool, "search_brave", fake_search_brave)
+    ctx = _FakeToolContext()
+
+    first = await jobs_tool.search_jobs_signal(["RevOps", "revops "], tool_context=ctx)
+    second = await jobs_tool.search_jobs_signal(["revops"], tool_context=ctx)
+
+    assert len(first["queries"]) == 4
+    assert sent == first["queries"]
+    assert second["results_by_query"] == []
+    assert len(second["skipped_duplicates"]) == 4
+
+
+async def test_search_jobs_signal_retries_queries_that_returned_errors(monkeypatch):
+    sent = []
+
+    async def fake_search_brave(query, num_results=10):
+        sent.append(query)
+        if len(sent) == 1:
+            return {"query": query, "results": [], "error": "Brave API error: 503"}
+        return {"query": query, "results": []}
+
+    monkeypatch.setattr(jobs_tool, "search_brave", fake_search_brave)
+    ctx = _FakeToolContext()
+
+    first = await jobs_tool.search_jobs_signal(["revops"], tool_context=ctx)
+    second = await jobs_tool.search_jobs_signal(["revops"], tool_context=ctx)
+
+    assert len(first["errors"]) == 1
+    assert second["results_by_query"] == [{"query": sent[0], "results": []}]
+    assert second["skipped_duplicates"] == first["queries"][1:]
+
+
+async def test_get_openalex_works_batch_fetches_all_ids_in_one_request(
+    monkeypatch, fake_http, openalex_cache
+):
+    calls = []
+    payload = {
+        "results": [
+            {
+                "id": "https://openalex.org/W1",
+                "display_name": "Paper one",
+                "abstract_inverted_index": {"hello": [0], "world": [1]},
+            },
+        ]
+    }
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append((url, params))
+        return _FakeResponse(payload)
+
+    fake_http(openalex_tool, get=fake_get)
+    monkeypatch.delenv("OPENALEX_MAILTO", raising=False)
+
+    result = await openalex_tool.get_openalex_works_batch(
+        ["https://openalex.org/W1", "W2", "W1"]
+    )
+
+    assert len(calls) == 1
+    assert calls[0][0].endswith("/works")
+    assert calls[0][1] == {"filter": "openalex_id:W1|W2", "per-page": 2}
+    assert result["works"][0]["abstract"] == "hello world"
+    assert result["missing"] == ["W2"]
+
+
+def test_reconstruct_abstract_joins_only_words_within_char_limit():
+    inv_index = {"alpha": [0, 3], "beta": [1], "gamma": [2]}
+    full = openalex_tool._reconstruct_abstract(inv_index)
+
+    assert full == "alpha beta gamma alpha"
+    for limit in range(len(full) + 2):
+        assert openalex_tool._reconstruct_abstract(inv_index, limit) == full[:limit]
+
+
+def test_rank_openalex_results_prefers_cited_recent_work():
+    works = [
+        {"id": "old", "cited_by_count": 1000, "publication_year": 2000},
+        {"id": "new", "cited_by_count": 10, "publication_year": 2025},
+        {"id": "both", "cited_by_count": 800, "publication_year": 2024},
+        {"id": "none", "cited_by_count": 0, "publication_year": None},
+    ]
+
+    ranked = openalex_tool.rank_openalex_results(works, k=3, current_year=2025)
+
+    assert [w["id"] for w in ranked] == ["both", "new", "old"]
+
+
+async def test_search_openalex_multi_reports_failed_queries(fake_http, openalex_cache):
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        if params["search"] == "broken":
+            raise ValueError("bad query")
+        return _FakeResponse({"meta": {"count": 1}, "results": []})
+
+    fake_http(openalex_tool, get=fake_get)
+
+    result = await openalex_tool.search_openalex_multi(["ok", "broken", "ok "])
+
+    assert [r["query"] for r in result["results"]] == ["ok"]
+    assert result["errors"] == ["broken: bad query"]
+
+
+async def test_search_openalex_serves_repeat_calls_from_cache(fake_http, openalex_cache):
+    calls = []
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(params["search"])
+        return _FakeResponse({"meta": {"count": 0}, "results": []})
+
+    fake_http(openalex_tool, get=fake_get)
+
+    first = await openalex_tool.search_openalex("ai tutors", num_results=5)
+    second = await openalex_tool.search_openalex("ai tutors", num_results=5)
+    await openalex_tool.search_openalex("ai tutors", num_results=10)
+
+    assert first == second
+    assert calls == ["ai tutors", "ai tutors"]
+
+
+async def test_search_openalex_cache_key_ignores_call_style(fake_http, openalex_cache):
+    calls = []
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(params["search"])
+        return _FakeResponse({"meta": {"count": 0}, "results": []})
+
+    fake_http(openalex_tool, get=fake_get)
+
+    await openalex_tool.search_openalex(query="ai tutors", num_results=10)
+    await openalex_tool.search_openalex("ai tutors", 10)
+    await openalex_tool.search_openalex("ai tutors", auto_rank=True)
+
+    assert calls == ["ai tutors"]
+
+
+async def test_openalex_requests_join_polite_pool_when_mailto_set(
+    monkeypatch, fake_http, openalex_cache
+):
+    captured = {}
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        captured["params"] = params
+        captured["headers"] = headers
+        return _FakeResponse({"id": "https://openalex.org/W1", "display_name": "Paper"})
+
+    fake_http(openalex_tool, get=fake_get)
+    monkeypatch.setenv("OPENALEX_MAILTO", "team@example.com")
+
+    await openalex_tool.get_openalex_work_details("W1")
+
+    assert captured["params"]["mailto"] == "team@example.com"
+    assert "mailto:team@example.com" in captured["headers"]["User-Agent"]
+
+
+async def test_search_openalex_selects_only_kept_fields(monkeypatch, fake_http, openalex_cache):
+    captured = {}
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        captured["params"] = params
+        return _FakeResponse({"meta": {"count": 0}, "results": []})
+
+    fake_http(openalex_tool, get=fake_get)
+    monkeypatch.delenv("OPENALEX_MAILTO", raising=False)
+
+    await openalex_tool.search_openalex("edge inference")
+
+    assert captured["params"]["per-page"] == 10
+    assert set(captured["params"]["select"].split(",")) == {
+        "id",
+        "display_name",
+        "publication_year",
+        "cited_by_count",
+        "concepts",
+    }
+
+
+async def test_cached_search_brave_coalesces_concurrent_queries(monkeypatch, fake_http):
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append(params["q"])
+        await release.wait()
+        return _FakeResponse({"web": {"results": [{"title": "G2", "url": "u"}]}})
+
+    fake_http(brave_tool, get=fake_get)
+    monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+    brave_cache.cached_search_brave.cache_clear()
+
+    pending = [
+        asyncio.ensure_future(brave_cache.cached_search_brave("crm reviews"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*pending)
+    again = await brave_cache.cached_search_brave(query="crm reviews", num_results=10)
+
+    assert calls == ["crm reviews"]
+    assert all(r == again for r in responses)
+    brave_cache.cached_search_brave.cache_clear()
+
+
+async def test_cached_search_brave_does_not_cache_errors(monkeypatch, fake_http):
+    monkeypatch.delenv("BRAVE_SEARCH_API_KEY", raising=False)
+    monkeypatch.setattr(brave_tool, "_load_env", lambda: None)
+    brave_cache.cached_search_brave.cache_clear()
+
+    first = await brave_cache.cached_search_brave("crm reviews")
+    monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        return _FakeResponse({"web": {"results": []}})
+
+    fake_http(brave_tool, get=fake_get)
+    second = await brave_cache.cached_search_brave("crm reviews")
+
+    assert first["error"]
+    assert "error" not in second
+    brave_cache.cached_search_brave.cache_clear()
+
+
+async def test_search_seo_intent_fans_out_concurrently_in_query_order(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_search_brave(query, num_results=10):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if query.endswith("tutorial"):
+            return {"query": query, "error": "rate limited", "results": []}
+        return {"query": query, "results": []}
+
+    monkeypatch.setattr(seo_tool, "search_brave", fake_search_brave)
+
+    result = await seo_tool.search_seo_intent(["crm"])
+
+    assert [r["query"] for r in result["results_by_query"]] == result["queries"]
+    assert result["errors"] == ['"crm" tutorial: rate limited']
+    assert in_flight["peak"] == len(result["queries"])
+
+
+async def test_search_tools_skip_sources_the_plan_did_not_select(monkeypatch, fake_reddit):
+    async def fail_get(*args, **kwargs):
+        raise AssertionError("unselected source must not hit the network")
+
+    async def fail_search_brave(*args, **kwargs):
+        raise AssertionError("unselected source must not hit Brave")
+
+    fake_reddit(get=fail_get)
+    monkeypatch.setattr(seo_tool, "search_brave", fail_search_brave)
+    ctx = _FakeToolContext()
+    ctx.state["research_plan"] = {"selected_sources": ["hackernews"]}
+
+    reddit = await reddit_tool.search_reddit("crm", tool_context=ctx)
+    seo = await seo_tool.search_seo_intent(["crm"], tool_context=ctx)
+
+    assert reddit == {"query": "crm", "skipped": True, "posts": []}
+    assert seo["skipped"] is True
+    assert seo["queries"] == []
@@ -1,43 +1,83 @@
 """Tests for buyer-intent source expansion and stricter synthesis rules."""
 
-from product_validator_search.agent import (
-    ResearchPlan,
-    SOURCE_NAMES,
-    final_validator,
-    plan_generator,
-    market_research,
-    buyer_intent_research,
-)
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
 from product_validator_search.config import config
-from product_validator_search.resilient_parallel_agent import ResilientParallelAgent
+from product_validator_search.source_gate import SKIPPED_REPORT
 from product_validator_search.sources.jobs_signal.jobs_signal_agent import (
     JobsSignalValidation,
     jobs_signal_researcher,
 )
+from product_validator_search.sources.multi_source_validator import (
+    _skip_unless_any_selected,
+    _split_validation_callback,
+    multi_source_validator,
+)
 from product_validator_search.sources.review_sites.review_sites_agent import (
-    ReviewSitesValidation,
     review_sites_researcher,
 )
 from product_validator_search.sources.seo_intent.seo_intent_agent import (
-    SeoIntentValidation,
     seo_intent_researcher,
 )
 
+FINAL_VALIDATOR_REQUIRED = frozenset(
+    {
+        "## Evidence Quality",
+        "## Contradictions",
+        "## What Would Invalidate This Idea",
+        "## What Was Actually Invalidated",
+        "## Falsification Criteria Check",
+        "## Supporting Evidence Reliability Assessment",
+        "## Contradiction Reliability Assessment",
+        "## Deep-Dive Verification Outcomes",
+        "## Net Evidence Conclusion",
+        "## Why This Might Still Fail",
+        "source citation",
+        "contradiction penalty",
+        "critical invalidation findings",
+        "falsification criteria",
+        "Weak supporting evidence cannot count toward `PROCEED` thresholds.",
+        "Weak contradictions reduce confidence",
+        "Cap confidence at `medium`",
+        "reason taxonomy tag",
+    }
+)
+_WEIGHTED_SOURCES = frozenset(
+    {
+        "review_sites",
+        "competitors",
+        "google_trends",
+        "github",
+        "reddit",
+        "hackernews",
+        "openalex",
+        "brave_search",
+        "jobs_signal",
+        "seo_intent",
+    }
+)
+
 
+# Tests marked `slow` import product_validator_search.agent, which builds the
+# full root agent graph; the import stays inside each so that
+# `pytest -m "not slow"` skips the construction too.
+@pytest.mark.slow
 def test_new_sources_registered():
-    assert isinstance(market_research, ResilientParallelAgent)
-    assert isinstance(buyer_intent_research, ResilientParallelAgent)
+    from product_validator_search.agent import SOURCE_NAMES
+
+    # Batch membership is covered by test_imports.test_imports.
     assert "review_sites" in SOURCE_NAMES
     assert "jobs_signal" in SOURCE_NAMES
     assert "seo_intent" in SOURCE_NAMES
 
-    buyer_names = {agent.name for agent in buyer_intent_research.sub_agents}
-    assert "review_sites_agent" in buyer_names
-    assert "jobs_signal_agent" in buyer_names
-    assert "seo_intent_agent" in buyer_names
-
 
+@pytest.mark.slow
 def test_research_plan_supports_dual_hypothesis_fields():
+    from product_validator_search.agent import ResearchPlan
+
     model_fields = ResearchPlan.model_fields
     assert "validation_keywords" in model_fields
     assert "invalidation_keywords" in model_fields
@@ -48,7 +88,10 @@ def test_research_plan_supports_dual_hypothesis_fields():
     assert "evidence_validation_rules" in model_fields
 
 
+@pytest.mark.slow
 def test_plan_generator_requires_invalidation_track():
+    from product_validator_search.agent import plan_generator
+
     prompt = plan_generator.instruction
     assert "Thesis + anti-thesis required" in prompt
     assert "validation_keywords" in prompt
@@ -60,49 +103,41 @@ def test_plan_generator_requires_invalidation_track():
     assert "Source rationale must mention invalidation value" in prompt
 
 
-def test_buyer_intent_validation_schemas():
-    review = ReviewSitesValidation(
-        recommendation="pivot",
-        signal_score=58,
-        confidence="medium",
-        evidence_strength=60,
-        evidence_quality="moderate",
-        review_volume_signal="Moderate volume in last 12 months",
-        avg_rating_signal="3.9/5 weighted estimate",
-        top_switching_reasons=["Poor onboarding", "Weak integrations"],
-        price_sensitivity_mentions=["Too expensive for SMB", "Pricing is unclear"],
-        reasoning="Clear pain exists, but wedge is not yet differentiated.",
-    )
-    assert review.recommendation == "pivot"
-    assert review.evidence_quality == "moderate"
+def test_review_sites_validation_schema(review_validation):
+    assert review_validation.recommendation == "pivot"
+    assert review_validation.evidence_quality == "moderate"
 
-    jobs = JobsSignalValidation(
-        recommendation="proceed",
-        signal_score=74,
-        confidence="medium",
-        evidence_strength=71,
-        evidence_quality="strong",
-        hiring_velocity_signal="Consistent openings across enterprise firms",
-        roles_related_to_problem=["RevOps Analyst", "Sales Enablement Manager"],
-        enterprise_adoption_clues=["Implementation roles mention budget ownership"],
-        reasoning="Budget urgency appears sustained across multiple industries.",
-    )
-    assert jobs.recommendation == "proceed"
-    assert jobs.evidence_strength >= 70
 
-    seo = SeoIntentValidation(
-        recommendation="abandon",
-        signal_score=32,
+def test_jobs_signal_validation_schema(jobs_validation):
+    assert jobs_validation.recommendation == "proceed"
+    assert jobs_validation.evidence_strength >= 70
+
+
+def test_seo_intent_validation_schema(seo_validation):
+    assert seo_validation.recommendation == "abandon"
+    assert seo_validation.evidence_quality == "weak"
+
+
+def test_jobs_signal_validation_is_frozen_and_strict():
+    jobs = JobsSignalValidation(
+        recommendation="pivot",
+        signal_score=40,
         confidence="low",
-        evidence_strength=35,
-        evidence_quality="weak",
-        transactional_keyword_share="Low (~15%)",
-        estimated_cpc_band="low",
-        category_competitiveness="high",
-        reasoning="Commercial intent is weak in this category.",
+        key_findings=["Few enterprise openings"],
     )
-    assert seo.recommendation == "abandon"
-    assert seo.evidence_quality == "weak"
+    assert jobs.key_findings == ("Few enterprise openings",)
+    assert jobs.roles_related_to_problem == ()
+
+    with pytest.raises(ValidationError):
+        jobs.signal_score = 90
+
+    with pytest.raises(ValidationError):
+        JobsSignalValidation(
+            recommendation="pivot",
+            signal_score=40,
+            confidence="low",
+            unexpected_field="x",
+        )
 
 
 def test_new_researchers_preserve_skip_behavior():
@@ -111,45 +146,60 @@ def test_new_researchers_preserve_skip_behavior():
     assert 'If "seo_intent" is NOT in `selected_sources`' in seo_intent_researcher.instruction
 
 
+@pytest.mark.slow
 def test_final_validator_includes_evidence_and_contradictions_rules():
+    from product_validator_search.agent import final_validator
+
     prompt = final_validator.instruction
-    assert "## Evidence Quality" in prompt
-    assert "## Contradictions" in prompt
-    assert "## What Would Invalidate This Idea" in prompt
-    assert "## What Was Actually Invalidated" in prompt
-    assert "## Falsification Criteria Check" in prompt
-    assert "## Supporting Evidence Reliability Assessment" in prompt
-    assert "## Contradiction Reliability Assessment" in prompt
-    assert "## Deep-Dive Verification Outcomes" in prompt
-    assert "## Net Evidence Conclusion" in prompt
-    assert "## Why This Might Still Fail" in prompt
-    assert "source citation" in prompt
-    assert "contradiction penalty" in prompt
-    assert "critical invalidation findings" in prompt
-    assert "falsification criteria" in prompt
-    assert "Weak supporting evidence cannot count toward `PROCEED` thresholds." in prompt
-    assert "Weak contradictions reduce confidence" in prompt
-    assert "Cap confidence at `medium`" in prompt
-    assert "reason taxonomy tag" in prompt
+    missing = sorted(literal for literal in FINAL_VALIDATOR_REQUIRED if literal not in prompt)
+    assert not missing, f"Missing: {missing}"
 
 
 def test_source_weight_config_defaults():
-    expected = {
-        "review_sites",
-        "competitors",
-        "google_trends",
-        "github",
-        "reddit",
-        "hackernews",
-        "openalex",
-        "brave_search",
-        "jobs_signal",
-        "seo_intent",
-    }
-    assert set(config.source_evidence_weights) == expected
+    assert config.source_evidence_weights.keys() == _WEIGHTED_SOURCES
     assert config.source_evidence_weights["review_sites"] > config.source_evidence_weights["reddit"]
     assert config.adaptive_refinement_rounds == 2
     assert config.adaptive_run_condition == "conditional"
     assert config.adaptive_max_queries_per_round == 4
     assert config.evidence_corroboration_bar == "moderate"
     assert config.social_weak_signal_max_impact == "warning"
+
+
+def test_multi_source_validator_fans_out_per_source_state():
+    assert multi_source_validator.output_key == "multi_source_validation"
+
+    class _Ctx:
+        state = {
+            "multi_source_validation": {
+                "hackernews": {"recommendation": "pivot", "signal_score": 40, "confidence": "low"},
+                "jobs_signal": {
+                    "recommendation": "abandon",
+                    "signal_score": 10,
+                    "confidence": "low",
+                },
+            }
+        }
+
+    _split_validation_callback(_Ctx)
+
+    assert _Ctx.state["hackernews_validation"]["recommendation"] == "pivot"
+    assert _Ctx.state["jobs_signal_validation"]["signal_score"] == 10
+
+
+@pytest.mark.parametrize("selected", [["hackernews"], ["jobs_signal"], ["github", "hackernews"]])
+def test_multi_source_validator_runs_when_any_batched_source_selected(selected):
+    assert multi_source_validator.before_agent_callback is _skip_unless_any_selected
+
+    ctx = SimpleNamespace(state={"research_plan": {"selected_sources": selected}})
+    assert _skip_unless_any_selected(ctx) is None
+    assert "hackernews_raw_report" not in ctx.state
+
+
+def test_multi_source_validator_skips_llm_call_when_no_batched_source_selected():
+    ctx = SimpleNamespace(state={"research_plan": {"selected_sources": ["github", "reddit"]}})
+
+    reply = _skip_unless_any_selected(ctx)
+
+    assert reply.parts[0].text == SKIPPED_REPORT
+    assert ctx.state["hackernews_raw_report"] == SKIPPED_REPORT
+    assert ctx.state["jobs_signal_raw_report"] == SKIPPED_REPORT
@@ -1,4 +1,5 @@
 from product_validator_search.sources.brave_search.search_tool import search_brave
+import asyncio
 import json
 import os
 from dotenv import load_dotenv
@@ -13,7 +14,7 @@ def test_brave():
     )
 
     print("Running Brave Search query: 'OpenAI vs Google Gemini'...")
-    result = search_brave("OpenAI vs Google Gemini", num_results=3)
+    result = asyncio.run(search_brave("OpenAI vs Google Gemini", num_results=3))
 
     if result.get("error"):
         print(f"\n❌ Error: {result['error']}")